@@ -8,6 +8,7 @@ from snowflake.snowpark.functions import col
 
 
 import pandas as pd
+import numpy as np      # For vectorized column formatting
 
 import hashlib          # For creating cache keys from filter combinations
 import time            # For performance monitoring and retry logic
@@ -15,10 +16,16 @@ import json            # For serializing/deserializing saved search filters
 import re              # For phone number formatting and text validation
 import urllib.parse    # For URL encoding address parameters
 from datetime import datetime  # For timestamps in Salesforce integration
+from collections import deque  # For the bounded Cortex Analyst error queue
 
 import pydeck as pdk   # For interactive maps with business locations
 import math            # For map zoom calculations and coordinate math
 
+try:
+    import orjson      # Faster (C) JSON decoding for Cortex Analyst responses, when available
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 
 TABLE_CONFIG = {
@@ -43,9 +50,22 @@ DEFAULT_PAGE_SIZE = 100  # Default records per page (balanced for responsive des
 ROW_HEIGHT = 45  # Height of each row in data display (optimized for compact view)
 
 CACHE_TTL = 600  # Cache time-to-live in seconds (10 minutes)
+CORTEX_MODEL_PATH = "SANDBOX.CONKLIN.CORTEX_ANALYST_PROSPECTOR/lead_portal.yaml"  # Cortex Analyst semantic model on stage
+CORTEX_SEMANTIC_MODEL_FILE = f"@{CORTEX_MODEL_PATH}"  # Stage reference sent in every analyst request body
+CORTEX_API_ENDPOINT = "/api/v2/cortex/analyst/message"  # Cortex Analyst REST endpoint
+CORTEX_API_TIMEOUT = 50000  # Cortex Analyst request timeout (milliseconds)
+CORTEX_ERROR_LIMIT = 5  # Most recent Cortex Analyst errors kept for the consolidated error block
 
 DEFAULT_MAP_ZOOM = 9  # Default zoom level for map view
 SELECTED_BUSINESS_ZOOM = 15  # Zoom level when a single business is selected
+MAP_VIEWPORT_WIDTH = 800  # Assumed map viewport width (px) for fit-to-points zoom
+MAP_VIEWPORT_HEIGHT = 600  # Assumed map viewport height (px) for fit-to-points zoom
+LAT_ZOOM_BASE = math.log2(360 * MAP_VIEWPORT_HEIGHT / 256)  # lat_zoom = LAT_ZOOM_BASE - log2(lat span)
+LON_ZOOM_BASE = math.log2(360 * MAP_VIEWPORT_WIDTH / 256)  # lon_zoom = LON_ZOOM_BASE - log2(projected lon span)
+MAP_ZOOM_TIERS = np.array([9, 11, 13, 15])  # Integer zoom tier boundaries, looked up with searchsorted(side="right")
+SINGLE_SELECTION_ZOOM_SCALES = np.array([0.25, 0.25, 0.15, 0.075, 0.025])  # Selected radius scale per tier, one business
+MULTI_SELECTION_ZOOM_SCALES = np.array([4.0, 2.0, 0.5, 0.125, 0.025])  # Selected radius scale per tier, several businesses
+MAP_VIEW_RADIUS_ZOOM_SCALES = np.array([2.5, 2.5, 2.0, 1.5, 1.0])  # Map view point radius multiplier per tier
 CHIPS_PER_ROW = 3  # Number of filter chips per row for compact display
 
 MIN_DISPLAY_ROWS = 2  # Minimum rows to display in data tables
@@ -63,6 +83,15 @@ BUTTON_LABEL_CALL = "Call"
 BUTTON_LABEL_EMAIL = "Email"
 BUTTON_LABEL_GET_DIRECTIONS = "Get Directions"
 
+# Column order for the List View data editor (individual address fields are folded into FULL_ADDRESS)
+FINAL_COLUMN_ORDER = [
+    "Map", "SF", "Current Customer", "DBA_NAME", "ADDRESS_LINK", "FULL_ADDRESS", "PHONE", "WEBSITE",
+    "CONTACT_NAME", "CONTACT_EMAIL", "CONTACT_PHONE", "CONTACT_MOBILE", "CONTACT_JOB_TITLE",
+    "PRIMARY_INDUSTRY", "SUB_INDUSTRY", "SIC", "REVENUE", "NUMBER_OF_EMPLOYEES", "NUMBER_OF_LOCATIONS",
+    "IS_B2B", "IS_B2C", "DATA_AGG_UID", "PARENT_NAME", "PARENT_PHONE", "PARENT_WEBSITE",
+    "TOP10_CONTACTS", "CONTACT_NATIONAL_DNC", "INTERNAL_DNC", "HAS_CONTACT_INFO", "IDENTIFIER"
+]
+
 STATIC_FILTERS = {
     # Text-based search filters
     "DBA_NAME": {"type": "text", "label": "Business Name", "column_name": "DBA_NAME"},
@@ -112,6 +141,11 @@ STATIC_FILTERS = {
     }
 }
 
+# Filter keys grouped by filter type, built once from STATIC_FILTERS
+FILTERS_BY_TYPE = {}
+for filter_key, filter_config in STATIC_FILTERS.items():
+    FILTERS_BY_TYPE.setdefault(filter_config["type"], []).append(filter_key)
+
 retries = 3
 for attempt in range(retries):
     try:
@@ -128,7 +162,11 @@ st.set_page_config(page_title="Prospector POC", layout="wide")
 
 
 def initialize_session_state():
-
+    # Fast path - once every default key exists, skip rebuilding the defaults (widget keys can be
+    # dropped by Streamlit when their widget isn't rendered, so presence is checked rather than a bare flag)
+    default_keys = st.session_state.get("session_default_keys")
+    if default_keys and all(key in st.session_state for key in default_keys):
+        return
 
     defaults = {
         "filters": {
@@ -156,7 +194,7 @@ def initialize_session_state():
         "search_to_delete": None,           # Search marked for deletion
         # UI State Management
         "filter_update_trigger": {          # Tracks when dropdown filters need refreshing
-            col: 0 for col in STATIC_FILTERS if STATIC_FILTERS[col]["type"] == "dropdown"
+            col: 0 for col in FILTERS_BY_TYPE["dropdown"]
         },
         "reset_counter": 0,                 # Triggers filter reset when incremented
         "sidebar_collapsed": False,         # Controls sidebar visibility
@@ -168,7 +206,7 @@ def initialize_session_state():
         # Salesforce Integration (Simple ID tracking approach)
         "sf_pushed_count": 0,              # Count of businesses marked for Salesforce
         "sf_business_ids": [],             # List of business IDs to push to Salesforce
-        "sf_last_update": datetime.now().isoformat(),  # Timestamp of last Salesforce update
+        "sf_business_id_set": set(),       # Same IDs as a set for O(1) membership checks
         # Cortex Analyst Results
         "cortex_analyst_results": None,     # Results from Cortex Analyst
         # Contact Info Filter dropdown state
@@ -178,6 +216,12 @@ def initialize_session_state():
     for key, value in defaults.items():
         if key not in st.session_state:
             st.session_state[key] = value
+    
+    # Timestamp of last Salesforce update - only formatted when the key is actually missing
+    if "sf_last_update" not in st.session_state:
+        st.session_state["sf_last_update"] = datetime.now().isoformat()
+    
+    st.session_state["session_default_keys"] = (*defaults, "sf_last_update")
 
 
 def get_current_user(session):
@@ -204,22 +248,24 @@ def get_current_user(session):
         return "SIS_USER"
 
 
+def track_sf_business_ids(new_ids):
+    """Record untracked string business IDs for Salesforce, updating the counter and timestamp once per batch"""
+    ss = st.session_state
+    get_sf_business_id_set().update(new_ids)
+    # The list keeps push order for display
+    ss["sf_business_ids"].extend(new_ids)
+    ss["sf_pushed_count"] += len(new_ids)
+    ss["sf_last_update"] = datetime.now().isoformat()
+
 def add_business_to_salesforce(business_id):
     """Track business ID for Salesforce integration."""
     business_id_str = str(business_id)
     
-    
-    # Check if already tracked to avoid duplicates
-    if business_id_str in st.session_state["sf_business_ids"]:
+    # Check if already tracked to avoid duplicates (set lookup, not a list scan)
+    if business_id_str in get_sf_business_id_set():
         return False
     
-    # Add the new business ID
-    st.session_state["sf_business_ids"].append(business_id_str)
-    
-    # Update the counter and timestamp
-    st.session_state["sf_pushed_count"] = len(st.session_state["sf_business_ids"])
-    st.session_state["sf_last_update"] = datetime.now().isoformat()
-    
+    track_sf_business_ids([business_id_str])
     return True
 
 @st.cache_data(ttl=CACHE_TTL)
@@ -314,54 +360,81 @@ def build_radius_filter_sql(center_lat, center_lng, radius_miles, lat_col="LATIT
     
     return sql.strip()
 
-def run_cortex_analyst(sidebar_prompt, session, _snowflake, CORTEX_MODEL_PATH, API_ENDPOINT, API_TIMEOUT, rerun_on_success=True):
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def fetch_cortex_analyst_response(sidebar_prompt, semantic_model_file, api_endpoint, api_timeout, _snowflake_api):
+    """Send a prompt to Cortex Analyst and return the parsed response - error responses raise so they aren't cached"""
+    request_body = {
+        "messages": [{"role": "user", "content": [{"type": "text", "text": sidebar_prompt}]}],
+        "semantic_model_file": semantic_model_file,
+    }
+    resp = _snowflake_api.send_snow_api_request(
+        "POST", api_endpoint, {}, {}, request_body, None, api_timeout
+    )
+    status = resp.get("status", 500)
+    content = resp.get("content") or "{}"
+    if status >= 400:
+        # Only JSON error bodies are decoded (for their message) - empty or plain-text bodies skip the parse
+        content = content.decode("utf-8", "replace") if isinstance(content, bytes) else content
+        error_message = "Unknown error"
+        if content.lstrip()[:1] == "{":
+            error_message = json_loads(content).get("message", error_message)
+        elif content.strip():
+            error_message = content
+        raise RuntimeError(f"Cortex Analyst API error (status {status}): {error_message}")
+    return json_loads(content)
+
+def run_cortex_analyst(sidebar_prompt, session, _snowflake, rerun_on_success=True):
     """Run Cortex Analyst API and update session state. Returns True if successful."""
-    cortex_messages = []
-    cortex_messages.append({
+    ss = st.session_state
+    cortex_messages = [{
         "role": "user",
         "content": [{"type": "text", "text": sidebar_prompt}],
-    })
-    request_body = {
-        "messages": cortex_messages,
-        "semantic_model_file": f"@{CORTEX_MODEL_PATH}",
-    }
+    }]
     try:
-        resp = _snowflake.send_snow_api_request(
-            "POST", API_ENDPOINT, {}, {}, request_body, None, API_TIMEOUT
+        # Repeat prompts are answered from the cache instead of another API round trip
+        parsed_content = fetch_cortex_analyst_response(
+            sidebar_prompt, CORTEX_SEMANTIC_MODEL_FILE, CORTEX_API_ENDPOINT, CORTEX_API_TIMEOUT, _snowflake
         )
-        parsed_content = json.loads(resp["content"])
-        if resp["status"] < 400:
-            analyst_message = {
-                "role": "analyst",
-                "content": parsed_content["message"]["content"],
-                "request_id": parsed_content["request_id"],
-            }
-            st.session_state["cortex_messages"] = cortex_messages + [analyst_message]
-            st.session_state["last_sidebar_cortex_prompt"] = sidebar_prompt
-            for item in analyst_message["content"]:
-                if item.get("type") == "sql" and "statement" in item:
-                    try:
-                        cortex_df = session.sql(item["statement"]).to_pandas()
-                        st.session_state["filtered_df"] = cortex_df
-                        st.session_state["total_records"] = len(cortex_df)
-                    except Exception as e:
-                        st.error(f"Error executing Cortex SQL for List/Map View: {e}")
-                    break
-            if rerun_on_success:
-                st.session_state["analyst_running"] = False
-            return True
-        else:
-            st.error(f"Cortex Analyst API error: {parsed_content.get('message', 'Unknown error')}")
+        analyst_message = {
+            "role": "analyst",
+            "content": parsed_content["message"]["content"],
+            "request_id": parsed_content["request_id"],
+        }
+        ss["cortex_messages"] = cortex_messages + [analyst_message]
+        # The dirty flag makes main() execute the analyst SQL once for List/Map View
+        ss["cortex_messages_dirty"] = True
+        ss["last_sidebar_cortex_prompt"] = sidebar_prompt
+        # Only write the flag when it actually changes
+        if rerun_on_success and ss.get("analyst_running", False):
+            ss["analyst_running"] = False
+        return True
+    except RuntimeError as e:
+        ss.setdefault("cortex_errors", deque(maxlen=CORTEX_ERROR_LIMIT)).append(str(e))
     except Exception as e:
-        st.error(f"Error running Cortex Analyst: {e}")
-    st.session_state["analyst_running"] = False
+        ss.setdefault("cortex_errors", deque(maxlen=CORTEX_ERROR_LIMIT)).append(f"Error running Cortex Analyst: {e}")
+    if ss.get("analyst_running", False):
+        ss["analyst_running"] = False
     return False
 
+def downcast_integer_columns(df):
+    """Shrink integer columns to the smallest integer dtype that holds their values"""
+    int_cols = df.select_dtypes(include="integer").columns
+    if len(int_cols):
+        df[int_cols] = df[int_cols].apply(pd.to_numeric, downcast="integer")
+    return df
 
-initialize_session_state()
 
+@st.cache_data(show_spinner=False)
+def minify_css(css):
+    """Strip comments and collapse whitespace in a <style> block (cached per CSS string)"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    # No whitespace is needed around these - ':' and parentheses are left alone (selectors, media queries)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
 
-st.markdown("""
+# App-wide Global Payments theme (fonts, variables, layout, widgets, responsive rules) - results styling lives in GP_RESULTS_CSS
+GP_CSS = """
     <style>
     /* Import DM Sans font from Google Fonts - Global Payments brand typography */
     @import url('https://fonts.googleapis.com/css2?family=DM+Sans:ital,opsz,wght@0,9..40,100..1000;1,9..40,100..1000&display=swap');
@@ -450,15 +523,21 @@ st.markdown("""
         --gp-ease-in-out: cubic-bezier(0.4, 0, 0.2, 1);
         --gp-ease-bounce: cubic-bezier(0.68, -0.55, 0.265, 1.55);
         --gp-ease-back: cubic-bezier(0.34, 1.56, 0.64, 1);
-    }
-
-    /* Selective DM Sans font application - avoid overriding Material Icons */
-    html, body, .stApp, [data-testid="stAppViewContainer"] {
-        font-family: var(--font-family-primary) !important;
-        line-height: var(--line-height-base);
-    }
-    
-    /* Apply DM Sans to main content areas but not icon components */
+        
+        /* Gradient System - defined once, referenced by components */
+        --gp-gradient-primary: linear-gradient(135deg, var(--gp-primary) 0%, var(--gp-accent) 100%);
+        --gp-gradient-surface: linear-gradient(135deg, var(--gp-surface) 0%, var(--gp-background) 100%);
+        --gp-gradient-light: linear-gradient(135deg, #ffffff 0%, #f8f9ff 100%);
+        --gp-gradient-light-alt: linear-gradient(135deg, #f6f8ff 0%, #ffffff 100%);
+        --gp-gradient-muted: linear-gradient(135deg, #ffffff 0%, #fafbff 100%);
+        --gp-gradient-dark: linear-gradient(135deg, #1a1b23 0%, #2e3748 100%);
+        --gp-gradient-hover: linear-gradient(135deg, #1b1c6e 0%, #2d5a87 100%);
+    }
+
+    /* Selective DM Sans font application - one rule for app roots, content areas, labels and text elements.
+       Icon components are deliberately not listed (Material Icons keep their font); custom gp-* markup
+       inherits DM Sans from the markdown containers below instead of repeating font-family per class */
+    html, body, .stApp, [data-testid="stAppViewContainer"],
     .main .block-container,
     [data-testid="stSidebar"],
     [data-testid="stHeader"],
@@ -467,24 +546,17 @@ st.markdown("""
     [data-testid="stMarkdown"],
     [data-testid="stText"],
     [data-testid="metric-container"],
-    .stSelectbox label, 
-    .stTextInput label, 
+    [data-testid="stMarkdownContainer"],
+    .stSelectbox label,
+    .stTextInput label,
     .stNumberInput label,
     .stMultiSelect label,
     .stSlider label,
     .stCheckbox label,
-    .stRadio label {
-        font-family: var(--font-family-primary) !important;
-        line-height: var(--line-height-base);
-    }
-
-    /* Targeted text styling - DM Sans for specific text elements */
-    h1, h2, h3, h4, h5, h6, p, 
+    .stRadio label,
+    h1, h2, h3, h4, h5, h6, p,
     .stMarkdown, .stText, .stHeader, .stSubheader, .stTitle,
-    .stDataFrame, .stTable, .stMetric,
-    [data-testid="stMarkdownContainer"], 
-    [data-testid="stText"],
-    [data-testid="metric-container"] {
+    .stDataFrame, .stTable, .stMetric {
         font-family: var(--font-family-primary) !important;
         line-height: var(--line-height-base);
     }
@@ -527,652 +599,344 @@ st.markdown("""
         from { opacity: 0; transform: translateY(10px); }
         to { opacity: 1; transform: translateY(0); }
     }
+
+    /* =============================================================================
+     * UTILITY CLASSES - only the gp-* classes the app's markup uses
+     * ============================================================================= */
     
-    @keyframes gp-scale-in {
-        from { opacity: 0; transform: scale(0.9); }
-        to { opacity: 1; transform: scale(1); }
-    }
+    /* Inline Style Utilities */
+    .gp-center-text { text-align: center !important; }
+    .gp-color-primary { color: var(--gp-primary) !important; }
+    .gp-font-sm { font-size: 0.8rem !important; }
     
-    @keyframes gp-pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.7; }
+    /* Apply gradients to specific components */
+    .business-details-card h3,
+    .step-icon {
+        background: var(--gp-gradient-primary) !important;
     }
     
-    @keyframes gp-shake {
-        0%, 100% { transform: translateX(0); }
-        10%, 30%, 50%, 70%, 90% { transform: translateX(-2px); }
-        20%, 40%, 60%, 80% { transform: translateX(2px); }
+    .business-data-timeline {
+        background: var(--gp-gradient-surface) !important;
     }
     
-    @keyframes gp-rotate {
-        from { transform: rotate(0deg); }
-        to { transform: rotate(360deg); }
-    }
-
     /* =============================================================================
-     * ESSENTIAL ANIMATION CLASSES - Streamlined
+     * STREAMLIT SPECIFIC ANIMATIONS - Simplified
      * ============================================================================= */
     
-    .gp-animate-fade-in {
-        animation: gp-fade-in var(--gp-transition-base) var(--gp-ease-out) forwards;
-    }
-    
-    .gp-animate-scale-in {
-        animation: gp-scale-in var(--gp-transition-base) var(--gp-ease-back) forwards;
+    /* Animate Streamlit components on load */
+    [data-testid="stMarkdown"] {
+        animation: gp-fade-in var(--gp-transition-base) var(--gp-ease-out);
     }
     
-    .gp-animate-pulse {
-        animation: gp-pulse 2s infinite;
+    [data-testid="stMetric"] {
+        animation: gp-fade-in var(--gp-transition-slow) var(--gp-ease-out);
     }
     
-    .gp-animate-spin {
-        animation: gp-rotate 1s linear infinite;
+    [data-testid="stDataFrame"] {
+        animation: gp-fade-in var(--gp-transition-slow) var(--gp-ease-out);
     }
     
-    .gp-animate-shake {
-        animation: gp-shake 0.5s ease-in-out;
+    /* Sidebar animation */
+    [data-testid="stSidebar"] {
+        animation: gp-fade-in var(--gp-transition-slower) var(--gp-ease-out);
     }
-
-    /* =============================================================================
-     * CORE TRANSITIONS - Simplified
-     * ============================================================================= */
     
-    .gp-transition {
-        transition: all var(--gp-transition-base);
+    /* Main content animation */
+    .main .block-container {
+        animation: gp-fade-in var(--gp-transition-slower) var(--gp-ease-out);
     }
     
-    .gp-transition-fast {
-        transition: all var(--gp-transition-fast);
-    }
-
     /* =============================================================================
-     * ESSENTIAL HOVER EFFECTS
+     * ACCESSIBILITY - Respect user's motion preferences
      * ============================================================================= */
     
-    .gp-hover-lift:hover {
-        transform: translateY(-2px);
-        box-shadow: var(--gp-shadow-lg);
-    }
-    
-    .gp-focus-ring:focus {
-        outline: 2px solid var(--gp-primary);
-        outline-offset: 2px;
-        box-shadow: 0 0 0 4px rgba(38, 42, 255, 0.1);
+    @media (prefers-reduced-motion: reduce) {
+        /* Only classed app nodes (and their pseudo-elements) carry animations/transitions; :where() keeps element
+           specificity at zero - pseudo-elements aren't allowed inside :where(), so they are listed separately */
+        .stApp :where([class]),
+        .stApp [class]::before,
+        .stApp [class]::after {
+            animation-duration: 0.01ms !important;
+            animation-iteration-count: 1 !important;
+            transition-duration: 0.01ms !important;
+            scroll-behavior: auto !important;
+        }
     }
 
-    /* =============================================================================
-     * UTILITY CLASSES - Reusable UI Components
-     * ============================================================================= */
-    
-    /* Essential Spacing Utilities - Most Used Only */
-    .gp-mb-md { margin-bottom: var(--gp-space-md) !important; }
-    .gp-p-md { padding: var(--gp-space-md) !important; }
-    .gp-gap-md { gap: var(--gp-space-md) !important; }
-    .gp-section-spacing { margin-top: var(--gp-space-lg) !important; }
-    
-    /* Common Gradient Utilities */
-    .gp-gradient-primary { background: linear-gradient(135deg, var(--gp-primary) 0%, var(--gp-accent) 100%) !important; }
-    .gp-gradient-surface { background: linear-gradient(135deg, var(--gp-surface) 0%, var(--gp-background) 100%) !important; }
-    .gp-gradient-light { background: linear-gradient(135deg, #ffffff 0%, #f8f9ff 100%) !important; }
-    .gp-gradient-light-alt { background: linear-gradient(135deg, #f6f8ff 0%, #ffffff 100%) !important; }
-    .gp-gradient-muted { background: linear-gradient(135deg, #ffffff 0%, #fafbff 100%) !important; }
-    .gp-gradient-dark { background: linear-gradient(135deg, #1a1b23 0%, #2e3748 100%) !important; }
-    .gp-gradient-hover { background: linear-gradient(135deg, #1b1c6e 0%, #2d5a87 100%) !important; }
-    
-    /* Common Container Styles */
-    .gp-container-elevated {
-        background: var(--gp-background);
-        border: 1px solid var(--gp-border);
+    /* Button styling - Enhanced with animation system */
+    .stButton > button {
+        width: 100%;
+        padding: 0.75rem;
+        font-size: var(--font-size-base);
         border-radius: var(--gp-radius-lg);
-        box-shadow: var(--gp-shadow-md);
-        padding: var(--gp-space-md);
-    }
-    
-    /* Inline Style Utilities */
-    .gp-center-text { text-align: center !important; }
-    .gp-bold { font-weight: 600 !important; }
-    .gp-color-primary { color: var(--gp-primary) !important; }
-    .gp-color-white { color: var(--gp-white) !important; }
-    .gp-font-sm { font-size: 0.8rem !important; }
-    .gp-font-xs { font-size: 0.7rem !important; }
-    
-    /* Apply gradients to specific components */
-    .business-details-card h3,
-    .step-icon,
-    .gp-progress-bar {
-        background: var(--gp-gradient-primary) !important;
-    }
-    
-    .business-data-timeline {
-        background: var(--gp-gradient-surface) !important;
-    }
-    
-    /* Apply gradient utility classes to other elements */
-    .gp-apply-primary-gradient { background: var(--gp-gradient-primary) !important; }
-    .gp-apply-surface-gradient { background: var(--gp-gradient-surface) !important; }
-    .gp-card {
-        background: var(--gp-background);
-        border: 1px solid var(--gp-border);
-        border-radius: var(--gp-radius-xl);
-        padding: var(--gp-space-md);
+        min-height: var(--button-height);
+        background-color: var(--gp-primary);
+        color: var(--gp-white);
+        border: none;
+        transition: var(--gp-transition-base) var(--gp-ease-out);
+        transition-property: background-color, border-color, box-shadow, transform;
+        font-weight: 500;
+        font-family: var(--font-family-primary) !important;
         box-shadow: var(--gp-shadow-sm);
-        transition: all var(--gp-transition-slow) var(--gp-ease-out);
-        font-family: var(--font-family-primary);
         position: relative;
         overflow: hidden;
     }
     
-    .gp-card:hover {
-        box-shadow: var(--gp-shadow-md);
-        transform: translateY(-2px) scale(1.01);
-        border-color: var(--gp-accent);
+    .stButton > button::before {
+        content: '';
+        position: absolute;
+        top: 0;
+        left: -100%;
+        width: 100%;
+        height: 100%;
+        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
+        transition: left var(--gp-transition-slow) var(--gp-ease-out);
     }
     
-    .gp-card-header {
-        border-bottom: 1px solid var(--gp-border);
-        padding-bottom: var(--gp-space-sm);
-        margin-bottom: var(--gp-space-md);
+    .stButton > button:hover::before {
+        left: 100%;
     }
     
-    .gp-card-title {
-        font-size: 1.1rem;
-        font-weight: 600;
+    .stButton > button[kind="secondary"] {
+        background-color: var(--gp-surface);
         color: var(--gp-text-primary);
-        margin: 0;
-        font-family: var(--font-family-primary);
+        border: 2px solid var(--gp-border);
+        font-family: var(--font-family-primary) !important;
     }
     
-
-    
-
-    
-    /* Status Indicator Component */
-    .gp-status {
-        display: inline-flex;
-        align-items: center;
-        gap: var(--gp-space-xs);
-        font-size: 0.8rem;
-        font-family: var(--font-family-primary);
+    .stButton > button:hover {
+        background-color: var(--gp-deep-blue);
+        transform: translateY(-1px) scale(1.02);
+        box-shadow: var(--gp-shadow-hover);
     }
     
-    .gp-status-dot {
-        width: 8px;
-        height: 8px;
-        border-radius: var(--gp-radius-full);
-        flex-shrink: 0;
+    .stButton > button[kind="secondary"]:hover {
+        background-color: var(--gp-surface);
+        border-color: var(--gp-accent);
+        transform: translateY(-1px);
+        box-shadow: var(--gp-shadow-md);
     }
     
-    .gp-status-active .gp-status-dot {
-        background-color: var(--gp-success);
-        box-shadow: 0 0 0 2px rgba(28, 171, 255, 0.2);
+    .stButton > button:active {
+        transform: translateY(0) scale(0.98);
+        transition: var(--gp-transition-fast);
+        transition-property: transform;
     }
-    
-    .gp-status-inactive .gp-status-dot {
-        background-color: var(--gp-border);
+
+    /* Input styling - Enhanced with animations */
+    .stTextInput > div > input, .stNumberInput > div > input {
+        font-size: var(--font-size-base);
+        padding: 0.5rem;
+        width: 100%;
+        border: 2px solid var(--gp-border);
+        border-radius: var(--gp-radius-md);
+        background-color: var(--gp-background);
+        font-family: var(--font-family-primary) !important;
+        transition: var(--gp-transition-base) var(--gp-ease-out);
+        transition-property: border-color, box-shadow, transform;
+        position: relative;
     }
     
-    .gp-status-error .gp-status-dot {
-        background-color: var(--gp-error);
-        box-shadow: 0 0 0 2px rgba(244, 54, 76, 0.2);
+    .stTextInput > div > input:hover, .stNumberInput > div > input:hover {
+        border-color: var(--gp-accent);
+        box-shadow: 0 0 0 1px rgba(28, 171, 255, 0.1);
     }
     
-    .gp-status-warning .gp-status-dot {
-        background-color: var(--gp-warning);
-        box-shadow: 0 0 0 2px rgba(255, 204, 0, 0.2);
+    .stTextInput > div > input:focus, .stNumberInput > div > input:focus {
+        border-color: var(--gp-primary);
+        box-shadow: 0 0 0 3px rgba(38, 42, 255, 0.1);
+        outline: none;
+        transform: scale(1.01);
     }
     
-    /* Layout Components */
-    .gp-flex {
-        display: flex;
+    .stSelectbox > div, .stMultiSelect > div {
+        font-size: var(--font-size-base);
+        width: 100%;
+        font-family: var(--font-family-primary) !important;
     }
     
-    .gp-flex-col {
-        flex-direction: column;
+    .stSelectbox > div > div {
+        border: 2px solid var(--gp-border);
+        border-radius: var(--gp-radius-md);
+        background-color: var(--gp-background);
+        font-family: var(--font-family-primary) !important;
+        transition: var(--gp-transition-base) var(--gp-ease-out);
+        transition-property: border-color, box-shadow;
     }
     
-    .gp-flex-wrap {
-        flex-wrap: wrap;
+    .stSelectbox > div > div:hover {
+        border-color: var(--gp-accent);
+        box-shadow: var(--gp-shadow-sm);
     }
     
-    .gp-items-center {
-        align-items: center;
+    .stSelectbox > div > div:focus-within {
+        border-color: var(--gp-primary);
+        box-shadow: 0 0 0 3px rgba(38, 42, 255, 0.1);
     }
-    
-    .gp-items-start {
-        align-items: flex-start;
+
+    /* Tabs - use Streamlit default styling */
+    .stTabs {
+        width: 100%;
     }
-    
-    .gp-items-end {
-        align-items: flex-end;
+    .stTabs [data-baseweb="tab-list"] {
+        width: 100%;
+        overflow-x: auto;
     }
-    
-    .gp-justify-center {
-        justify-content: center;
+    .stTabs [data-baseweb="tab"] {
+        white-space: nowrap;
+        min-width: fit-content;
     }
     
-    .gp-justify-between {
-        justify-content: space-between;
+    /* Sidebar styling with enhanced component system */
+    div[data-testid="stSidebar"] {
+        background-color: var(--gp-surface) !important;
+        border-right: 3px solid var(--gp-primary) !important;
     }
     
-    .gp-justify-start {
-        justify-content: flex-start;
+    div[data-testid="stSidebar"] .stButton > button {
+        width: 100%;
+        padding: 0.5rem;
+        font-size: 0.9rem;
+        min-height: 40px;
+        border-radius: var(--gp-radius-md);
+        background-color: var(--gp-primary);
+        color: var(--gp-white);
+        border: none;
+        margin-bottom: 0.25rem;
+        box-shadow: var(--gp-shadow-sm);
+        transition: 0.2s ease;
+        transition-property: background-color, border-color, box-shadow, transform;
+        font-family: var(--font-family-primary);
     }
-    
-    .gp-justify-end {
-        justify-content: flex-end;
+    div[data-testid="stSidebar"] .stButton > button[kind="secondary"] {
+        background-color: var(--gp-background);
+        color: var(--gp-text-primary);
+        border: 2px solid var(--gp-border);
     }
-    
-    .gp-grid {
-        display: grid;
+    div[data-testid="stSidebar"] .stButton > button:hover {
+        background-color: var(--gp-deep-blue);
+        box-shadow: var(--gp-shadow-md);
+        transform: translateY(-1px);
+    }
+    div[data-testid="stSidebar"] .stButton > button[kind="secondary"]:hover {
+        background-color: var(--gp-surface);
+        border-color: var(--gp-accent);
+        transform: translateY(-1px);
     }
     
-    .gp-grid-cols-1 { grid-template-columns: repeat(1, 1fr); }
-    .gp-grid-cols-2 { grid-template-columns: repeat(2, 1fr); }
-    .gp-grid-cols-3 { grid-template-columns: repeat(3, 1fr); }
-    .gp-grid-cols-4 { grid-template-columns: repeat(4, 1fr); }
-    .gp-grid-cols-auto { grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); }
-    
-    .gp-w-full { width: 100%; }
-    .gp-h-full { height: 100%; }
-    
-    /* Text Utilities */
-    .gp-text-center { text-align: center; }
-    .gp-text-left { text-align: left; }
-    .gp-text-right { text-align: right; }
-    
-    .gp-text-sm { font-size: 0.8rem; }
-    .gp-text-base { font-size: 1rem; }
-    .gp-text-lg { font-size: 1.1rem; }
-    .gp-text-xl { font-size: 1.25rem; }
-    
-    .gp-font-medium { font-weight: 500; }
-    .gp-font-semibold { font-weight: 600; }
-    .gp-font-bold { font-weight: 700; }
-    
-    .gp-text-primary { color: var(--gp-text-primary); }
-    .gp-text-secondary { color: var(--gp-text-secondary); }
-    .gp-text-success { color: var(--gp-success); }
-    .gp-text-warning { color: var(--gp-warning); }
-    .gp-text-error { color: var(--gp-error); }
-    
-    /* Metric Display Components */
-    .gp-metric {
-        background: var(--gp-background);
-        padding: var(--gp-space-md);
-        border-radius: var(--gp-radius-lg);
-        border: 1px solid var(--gp-border);
-        transition: all 0.2s ease;
-        position: relative;
-        overflow: hidden;
+    div[data-testid="stSidebar"] .stTextInput > div > input,
+    div[data-testid="stSidebar"] .stNumberInput > div > input {
+        font-size: 0.9rem;
+        padding: 0.5rem;
+        width: 100%;
+        border: 2px solid var(--gp-border);
+        border-radius: var(--gp-radius-md);
+        background-color: var(--gp-background);
+        transition: 0.2s ease;
+        transition-property: border-color, box-shadow;
+        font-family: var(--font-family-primary);
     }
-    
-    .gp-metric:hover {
+    div[data-testid="stSidebar"] .stTextInput > div > input:focus,
+    div[data-testid="stSidebar"] .stNumberInput > div > input:focus {
         border-color: var(--gp-primary);
-        box-shadow: var(--gp-shadow-md);
-        transform: translateY(-1px);
-    }
-    
-    .gp-metric::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        width: 3px;
-        height: 100%;
-        background: var(--gp-primary);
-        opacity: 0;
-        transition: opacity 0.2s ease;
-    }
-    
-    .gp-metric:hover::before {
-        opacity: 1;
+        box-shadow: 0 0 0 3px rgba(38, 42, 255, 0.1);
+        outline: none;
     }
     
-    .gp-metric-label {
-        font-size: 0.7rem;
-        font-weight: 500;
-        color: var(--gp-text-secondary);
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        margin-bottom: var(--gp-space-xs);
+    div[data-testid="stSidebar"] .stSelectbox > div,
+    div[data-testid="stSidebar"] .stMultiSelect > div {
+        font-size: 0.9rem;
+        width: 100%;
         font-family: var(--font-family-primary);
     }
-    
-    .gp-metric-value {
-        font-size: 1.5rem;
-        font-weight: 600;
-        color: var(--gp-text-primary);
-        line-height: 1.2;
-        margin-bottom: var(--gp-space-xs);
-        font-family: var(--font-family-primary);
+    div[data-testid="stSidebar"] .stSelectbox > div > div {
+        border: 2px solid var(--gp-border);
+        border-radius: var(--gp-radius-md);
+        background-color: var(--gp-background);
+        transition: 0.2s ease;
+        transition-property: border-color, box-shadow;
     }
     
-    .gp-metric-change {
-        font-size: 0.8rem;
-        font-weight: 500;
-        display: flex;
-        align-items: center;
-        gap: var(--gp-space-xs);
+    div[data-testid="stSidebar"] .stMarkdown,
+    div[data-testid="stSidebar"] label,
+    div[data-testid="stSidebar"] .stCheckbox > label {
+        font-size: 0.9rem;
+        color: var(--gp-text-primary);
         font-family: var(--font-family-primary);
     }
-    
-    .gp-metric-change.positive {
-        color: var(--gp-success);
-    }
-    
-    .gp-metric-change.negative {
-        color: var(--gp-error);
-    }
-    
-    .gp-metric-change.neutral {
-        color: var(--gp-text-secondary);
-    }
-    
-    .gp-metric-sm .gp-metric-value {
-        font-size: 1.2rem;
-    }
-    
-    .gp-metric-lg .gp-metric-value {
-        font-size: 2rem;
-    }
-    
-    .gp-metric-icon {
-        position: absolute;
-        top: var(--gp-space-md);
-        right: var(--gp-space-md);
+    div[data-testid="stSidebar"] h2,
+    div[data-testid="stSidebar"] h3 {
         font-size: 1.2rem;
-        opacity: 0.6;
-        color: var(--gp-primary);
-    }
-    
-    /* Loading State Components - Enhanced with animations */
-    .gp-loading {
-        display: inline-flex;
-        align-items: center;
-        gap: var(--gp-space-sm);
-        padding: var(--gp-space-sm) var(--gp-space-md);
-        background: var(--gp-surface);
-        border-radius: var(--gp-radius-md);
-        color: var(--gp-text-secondary);
+        color: var(--gp-text-primary);
+        border-bottom: 2px solid var(--gp-primary);
+        padding-bottom: 0.5rem;
+        margin-bottom: 1rem;
         font-family: var(--font-family-primary);
-        font-size: 0.9rem;
-        animation: gp-fade-in var(--gp-transition-base) var(--gp-ease-out);
-    }
-    
-    .gp-spinner {
-        width: 16px;
-        height: 16px;
-        border: 2px solid var(--gp-border);
-        border-top: 2px solid var(--gp-primary);
-        border-radius: var(--gp-radius-full);
-        animation: gp-rotate 1s linear infinite;
-    }
-    
-    .gp-spinner-lg {
-        width: 24px;
-        height: 24px;
-        border-width: 3px;
-    }
-    
-    .gp-spinner-sm {
-        width: 12px;
-        height: 12px;
-        border-width: 1px;
-    }
-    
-    .gp-skeleton {
-        background: linear-gradient(90deg, var(--gp-surface) 25%, var(--gp-border) 50%, var(--gp-surface) 75%);
-        background-size: 200% 100%;
-        animation: gp-skeleton-loading 1.5s infinite;
-        border-radius: var(--gp-radius-md);
-    }
-    
-    @keyframes gp-skeleton-loading {
-        0% { background-position: 200% 0; }
-        100% { background-position: -200% 0; }
     }
-    
-    .gp-skeleton-text {
-        height: 1em;
-        margin: var(--gp-space-xs) 0;
-    }
-    
-    .gp-skeleton-text.gp-skeleton-sm { height: 0.8em; }
-    .gp-skeleton-text.gp-skeleton-lg { height: 1.2em; }
-    
-    /* Progress Bar Component */
-    .gp-progress {
-        width: 100%;
-        height: 8px;
-        background: var(--gp-surface);
-        border-radius: var(--gp-radius-full);
-        overflow: hidden;
-        position: relative;
-    }
-    
-    .gp-progress-bar {
-        height: 100%;
-        border-radius: var(--gp-radius-full);
-        transition: width var(--gp-transition-slow) var(--gp-ease-out);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .gp-progress-bar::after {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);
-        animation: gp-progress-indeterminate 2s infinite linear;
-    }
-    
-    .gp-progress-sm {
-        height: 4px;
-    }
-    
-    .gp-progress-lg {
-        height: 12px;
-    }
-    
-
-    
-
-    
-
-    
 
-    
-    /* =============================================================================
-     * STREAMLIT SPECIFIC ANIMATIONS - Simplified
-     * ============================================================================= */
-    
-    /* Animate Streamlit components on load */
-    [data-testid="stMarkdown"] {
-        animation: gp-fade-in var(--gp-transition-base) var(--gp-ease-out);
-    }
-    
-    [data-testid="stMetric"] {
-        animation: gp-fade-in var(--gp-transition-slow) var(--gp-ease-out);
-    }
-    
-    [data-testid="stDataFrame"] {
-        animation: gp-fade-in var(--gp-transition-slow) var(--gp-ease-out);
-    }
-    
-    /* Sidebar animation */
-    [data-testid="stSidebar"] {
-        animation: gp-fade-in var(--gp-transition-slower) var(--gp-ease-out);
-    }
-    
-    /* Main content animation */
-    .main .block-container {
-        animation: gp-fade-in var(--gp-transition-slower) var(--gp-ease-out);
-    }
-    
-    /* =============================================================================
-     * ACCESSIBILITY - Respect user's motion preferences
-     * ============================================================================= */
-    
-    @media (prefers-reduced-motion: reduce) {
-        *,
-        *::before,
-        *::after {
-            animation-duration: 0.01ms !important;
-            animation-iteration-count: 1 !important;
-            transition-duration: 0.01ms !important;
-            scroll-behavior: auto !important;
+    @media (max-width: 768px) {
+        div[data-testid="stSidebar"] .stMarkdown,
+        div[data-testid="stSidebar"] label,
+        div[data-testid="stSidebar"] .stCheckbox > label {
+            font-size: 0.8rem;
         }
-        
-        .gp-animate-pulse,
-        .gp-animate-spin {
-            animation: none;
+        div[data-testid="stSidebar"] h2,
+        div[data-testid="stSidebar"] h3 {
+            font-size: 1.1rem;
         }
     }
-    
-    /* Responsive Utilities */
-    @media (max-width: 768px) {
-        .gp-hidden-mobile { display: none !important; }
-        .gp-grid-cols-mobile-1 { grid-template-columns: repeat(1, 1fr) !important; }
-        .gp-text-mobile-sm { font-size: 0.8rem !important; }
-        .gp-p-mobile-sm { padding: var(--gp-space-sm) !important; }
-    }
-    
-    @media (min-width: 769px) {
-        .gp-hidden-desktop { display: none !important; }
-    }
-    
-    /* =============================================================================
-     * END UTILITY CLASSES
-     * 
-     * USAGE EXAMPLES:
-     * 
-     * Basic Card:
-     * st.markdown('<div class="gp-card"><h3 class="gp-card-title">Title</h3><p>Content</p></div>', unsafe_allow_html=True)
-     * 
-     * Metric Display:
-     * st.markdown('<div class="gp-metric"><div class="gp-metric-label">Revenue</div><div class="gp-metric-value">$1.2M</div></div>', unsafe_allow_html=True)
-     * 
-     * Flex Layout:
-     * st.markdown('<div class="gp-flex gp-items-center gp-justify-between gp-gap-md">Content</div>', unsafe_allow_html=True)
-     * 
-     * Grid Layout:
-     * st.markdown('<div class="gp-grid gp-grid-cols-3 gp-gap-md">Grid Items</div>', unsafe_allow_html=True)
-     * 
-     * Loading State:
-     * st.markdown('<div class="gp-loading"><div class="gp-spinner"></div>Loading...</div>', unsafe_allow_html=True)
-     * 
-     * ============================================================================= */
 
-    /* Button styling - Enhanced with animation system */
-    .stButton > button {
-        width: 100%;
-        padding: 0.75rem;
-        font-size: var(--font-size-base);
-        border-radius: var(--gp-radius-lg);
-        min-height: var(--button-height);
-        background-color: var(--gp-primary);
-        color: var(--gp-white);
-        border: none;
-        transition: all var(--gp-transition-base) var(--gp-ease-out);
-        font-weight: 500;
-        font-family: var(--font-family-primary) !important;
-        box-shadow: var(--gp-shadow-sm);
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stButton > button::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(255,255,255,0.2), transparent);
-        transition: left var(--gp-transition-slow) var(--gp-ease-out);
-    }
-    
-    .stButton > button:hover::before {
-        left: 100%;
-    }
-    
-    .stButton > button[kind="secondary"] {
-        background-color: var(--gp-surface);
-        color: var(--gp-text-primary);
-        border: 2px solid var(--gp-border);
-        font-family: var(--font-family-primary) !important;
-    }
-    
-    .stButton > button:hover {
-        background-color: var(--gp-deep-blue);
-        transform: translateY(-1px) scale(1.02);
-        box-shadow: var(--gp-shadow-hover);
-    }
-    
-    .stButton > button[kind="secondary"]:hover {
-        background-color: var(--gp-surface);
-        border-color: var(--gp-accent);
-        transform: translateY(-1px);
-        box-shadow: var(--gp-shadow-md);
-    }
-    
-    .stButton > button:active {
-        transform: translateY(0) scale(0.98);
-        transition: all var(--gp-transition-fast);
-    }
-
-    /* Input styling - Enhanced with animations */
-    .stTextInput > div > input, .stNumberInput > div > input {
-        font-size: var(--font-size-base);
-        padding: 0.5rem;
-        width: 100%;
-        border: 2px solid var(--gp-border);
-        border-radius: var(--gp-radius-md);
-        background-color: var(--gp-background);
-        font-family: var(--font-family-primary) !important;
-        transition: all var(--gp-transition-base) var(--gp-ease-out);
-        position: relative;
-    }
-    
-    .stTextInput > div > input:hover, .stNumberInput > div > input:hover {
-        border-color: var(--gp-accent);
-        box-shadow: 0 0 0 1px rgba(28, 171, 255, 0.1);
-    }
-    
-    .stTextInput > div > input:focus, .stNumberInput > div > input:focus {
-        border-color: var(--gp-primary);
-        box-shadow: 0 0 0 3px rgba(38, 42, 255, 0.1);
-        outline: none;
-        transform: scale(1.01);
-    }
-    
-    .stSelectbox > div, .stMultiSelect > div {
-        font-size: var(--font-size-base);
-        width: 100%;
-        font-family: var(--font-family-primary) !important;
-    }
-    
-    .stSelectbox > div > div {
-        border: 2px solid var(--gp-border);
-        border-radius: var(--gp-radius-md);
-        background-color: var(--gp-background);
-        font-family: var(--font-family-primary) !important;
-        transition: all var(--gp-transition-base) var(--gp-ease-out);
+    @media (max-width: 480px) {
+        div[data-testid="stSidebar"] .stButton > button {
+            font-size: 0.7rem;
+            padding: 0.3rem;
+            min-height: 32px;
+        }
+        div[data-testid="stSidebar"] .stTextInput > div > input,
+        div[data-testid="stSidebar"] .stNumberInput > div > input {
+            font-size: 0.7rem;
+            padding: 0.3rem;
+        }
+        div[data-testid="stSidebar"] .stSelectbox > div,
+        div[data-testid="stSidebar"] .stMultiSelect > div {
+            font-size: 0.7rem;
+        }
+        div[data-testid="stSidebar"] .stMarkdown,
+        div[data-testid="stSidebar"] label,
+        div[data-testid="stSidebar"] .stCheckbox > label {
+            font-size: 0.7rem;
+        }
+        div[data-testid="stSidebar"] h2,
+        div[data-testid="stSidebar"] h3 {
+            font-size: 1rem;
+        }
     }
-    
-    .stSelectbox > div > div:hover {
-        border-color: var(--gp-accent);
-        box-shadow: var(--gp-shadow-sm);
+
+    /* Accessibility improvements */
+    .stButton > button:focus,
+    .stTextInput > div > input:focus,
+    .stNumberInput > div > input:focus,
+    .stSelectbox > div:focus,
+    .stMultiSelect > div:focus {
+        outline: 2px solid var(--gp-primary);
+        outline-offset: 2px;
     }
-    
-    .stSelectbox > div > div:focus-within {
-        border-color: var(--gp-primary);
-        box-shadow: 0 0 0 3px rgba(38, 42, 255, 0.1);
+
+    /* Low-power / slow-refresh displays - flat hover states, no shadow or transform layers.
+       !important plus the [kind] attribute outranks every button hover rule, including the sidebar's !important ones */
+    @media (prefers-reduced-transparency: reduce), (update: slow) {
+        .stApp .stButton > button[kind]:hover {
+            box-shadow: none !important;
+            border-color: var(--gp-primary) !important;
+            transform: none !important;
+        }
     }
+    </style>
+"""
 
+# Results-only styling (data editor, pagination, business details, dashboards, map) - skipped until there is data to show
+GP_RESULTS_CSS = """
+    <style>
     /* Data frame - responsive with Global Payments styling */
     .stDataFrame, .stDataEditor {
         width: 100%;
@@ -1226,8 +990,6 @@ st.markdown("""
     .stDataFrame::-webkit-scrollbar-thumb:hover, .stDataEditor::-webkit-scrollbar-thumb:hover {
         background: var(--gp-accent);
     }
-        border-bottom: 2px solid var(--gp-primary) !important;
-    }
 
     /* Pagination - Global Payments theme */
     .pagination-container {
@@ -1282,7 +1044,8 @@ st.markdown("""
         box-shadow: var(--gp-shadow-md);
         width: 100%;
         box-sizing: border-box;
-        transition: all 0.3s ease;
+        transition: 0.3s ease;
+        transition-property: box-shadow, transform;
         position: relative;
         overflow: hidden;
         padding: 0;
@@ -1305,7 +1068,7 @@ st.markdown("""
         position: relative;
         flex-wrap: nowrap;
         justify-content: space-between;
-        background-image: linear-gradient(135deg, var(--gp-primary) 0%, var(--gp-accent) 100%) !important;
+        background-image: var(--gp-gradient-primary) !important;
         z-index: 1;
     }
     .business-details-card h3::before {
@@ -1344,7 +1107,8 @@ st.markdown("""
         padding: 0.4rem;
         position: relative;
         border-left: 4px solid var(--gp-accent);
-        transition: all 0.2s ease;
+        transition: 0.2s ease;
+        transition-property: background, border-left-color, box-shadow;
         box-shadow: var(--gp-shadow-sm);
     }
     .data-viz-section:hover {
@@ -1374,7 +1138,6 @@ st.markdown("""
         display: flex;
         align-items: center;
         gap: 0.4rem;
-        font-family: var(--font-family-primary);
     }
     .section-header::before {
         content: '';
@@ -1416,7 +1179,8 @@ st.markdown("""
         padding: 0.75rem;
         border-radius: var(--gp-radius-lg);
         border: 1px solid var(--gp-border);
-        transition: all 0.2s ease;
+        transition: 0.2s ease;
+        transition-property: border-color, box-shadow, transform;
         position: relative;
         min-height: 60px;
         display: flex;
@@ -1444,7 +1208,6 @@ st.markdown("""
         letter-spacing: 0.5px;
         margin-bottom: 0.25rem;
         line-height: 1;
-        font-family: var(--font-family-primary);
     }
     .metric-value {
         font-size: 0.95rem;
@@ -1452,7 +1215,6 @@ st.markdown("""
         font-weight: 600;
         line-height: 1.2;
         word-break: break-word;
-        font-family: var(--font-family-primary);
     }
     .metric-value a {
         color: var(--gp-primary);
@@ -1508,7 +1270,6 @@ st.markdown("""
     }
     
     .timeline-header h3 {
-        font-family: var(--font-family-primary);
         font-weight: 700;
         color: var(--gp-text-secondary);
         margin: 0;
@@ -1524,7 +1285,8 @@ st.markdown("""
         border-radius: var(--gp-radius-xl);
         border: 1px solid var(--gp-border);
         box-shadow: var(--gp-shadow-sm);
-        transition: all 0.3s ease;
+        transition: 0.3s ease;
+        transition-property: border-color, box-shadow, transform;
     }
     
     .timeline-step:hover {
@@ -1582,7 +1344,6 @@ st.markdown("""
     }
     
     .step-title {
-        font-family: var(--font-family-primary);
         font-weight: 600;
         color: var(--gp-text-secondary);
         font-size: 16px;
@@ -1603,7 +1364,8 @@ st.markdown("""
         display: flex;
         flex-direction: column;
         gap: 4px;
-        transition: all 0.2s ease;
+        transition: 0.2s ease;
+        transition-property: background, border-left-color, box-shadow, transform;
         box-shadow: var(--gp-shadow-sm);
     }
     
@@ -1622,7 +1384,6 @@ st.markdown("""
     }
     
     .process-item-label {
-        font-family: var(--font-family-primary);
         font-size: 11px;
         font-weight: 500;
         color: var(--gp-text-secondary);
@@ -1632,7 +1393,6 @@ st.markdown("""
     }
     
     .process-item-value {
-        font-family: var(--font-family-primary);
         font-size: 14px;
         font-weight: 600;
         color: var(--gp-text-primary);
@@ -1654,7 +1414,7 @@ st.markdown("""
         margin-left: 80px;
         text-align: center;
         padding: 20px;
-        background: linear-gradient(135deg, var(--gp-primary), var(--gp-accent));
+        background: var(--gp-gradient-primary);
         color: var(--gp-white);
         border-radius: var(--gp-radius-xl);
         box-shadow: var(--gp-shadow-lg);
@@ -1690,7 +1450,8 @@ st.markdown("""
         border-radius: var(--gp-radius-lg);
         overflow: hidden;
         box-shadow: var(--gp-shadow-md);
-        transition: all 0.2s ease;
+        transition: 0.2s ease;
+        transition-property: border-color, box-shadow;
     }
     
     div[data-testid="stDeckGlJsonChart"]:hover {
@@ -1706,152 +1467,22 @@ st.markdown("""
     div[data-testid="stDeckGlJsonChart"] iframe {
         height: 100% !important;
     }
+    </style>
+"""
 
-    /* Tabs - use Streamlit default styling */
-    .stTabs {
-        width: 100%;
-    }
-    .stTabs [data-baseweb="tab-list"] {
-        width: 100%;
-        overflow-x: auto;
-    }
-    .stTabs [data-baseweb="tab"] {
-        white-space: nowrap;
-        min-width: fit-content;
-    }
-    
-    /* Sidebar styling with enhanced component system */
-    div[data-testid="stSidebar"] {
-        background-color: var(--gp-surface) !important;
-        border-right: 3px solid var(--gp-primary) !important;
-    }
-    
-    div[data-testid="stSidebar"] .stButton > button {
-        width: 100%;
-        padding: 0.5rem;
-        font-size: 0.9rem;
-        min-height: 40px;
-        border-radius: var(--gp-radius-md);
-        background-color: var(--gp-primary);
-        color: var(--gp-white);
-        border: none;
-        margin-bottom: 0.25rem;
-        box-shadow: var(--gp-shadow-sm);
-        transition: all 0.2s ease;
-        font-family: var(--font-family-primary);
-    }
-    div[data-testid="stSidebar"] .stButton > button[kind="secondary"] {
-        background-color: var(--gp-background);
-        color: var(--gp-text-primary);
-        border: 2px solid var(--gp-border);
-    }
-    div[data-testid="stSidebar"] .stButton > button:hover {
-        background-color: var(--gp-deep-blue);
-        box-shadow: var(--gp-shadow-md);
-        transform: translateY(-1px);
-    }
-    div[data-testid="stSidebar"] .stButton > button[kind="secondary"]:hover {
-        background-color: var(--gp-surface);
-        border-color: var(--gp-accent);
-        transform: translateY(-1px);
-    }
-    
-    div[data-testid="stSidebar"] .stTextInput > div > input,
-    div[data-testid="stSidebar"] .stNumberInput > div > input {
-        font-size: 0.9rem;
-        padding: 0.5rem;
-        width: 100%;
-        border: 2px solid var(--gp-border);
-        border-radius: var(--gp-radius-md);
-        background-color: var(--gp-background);
-        transition: all 0.2s ease;
-        font-family: var(--font-family-primary);
-    }
-    div[data-testid="stSidebar"] .stTextInput > div > input:focus,
-    div[data-testid="stSidebar"] .stNumberInput > div > input:focus {
-        border-color: var(--gp-primary);
-        box-shadow: 0 0 0 3px rgba(38, 42, 255, 0.1);
-        outline: none;
-    }
-    
-    div[data-testid="stSidebar"] .stSelectbox > div,
-    div[data-testid="stSidebar"] .stMultiSelect > div {
-        font-size: 0.9rem;
-        width: 100%;
-        font-family: var(--font-family-primary);
-    }
-    div[data-testid="stSidebar"] .stSelectbox > div > div {
-        border: 2px solid var(--gp-border);
-        border-radius: var(--gp-radius-md);
-        background-color: var(--gp-background);
-        transition: all 0.2s ease;
-    }
-    
-    div[data-testid="stSidebar"] .stMarkdown,
-    div[data-testid="stSidebar"] label,
-    div[data-testid="stSidebar"] .stCheckbox > label {
-        font-size: 0.9rem;
-        color: var(--gp-text-primary);
-        font-family: var(--font-family-primary);
-    }
-    div[data-testid="stSidebar"] h2,
-    div[data-testid="stSidebar"] h3 {
-        font-size: 1.2rem;
-        color: var(--gp-text-primary);
-        border-bottom: 2px solid var(--gp-primary);
-        padding-bottom: 0.5rem;
-        margin-bottom: 1rem;
-        font-family: var(--font-family-primary);
-    }
+def inject_gp_css():
+    """Emit the app-wide theme CSS (must run on every rerun - Streamlit drops elements a run doesn't re-emit)"""
+    # st.html skips the Markdown parse - pure <style> content needs none
+    st.html(minify_css(GP_CSS))
 
+def inject_results_css():
+    """Emit the results-view CSS - only called on runs that render List/Map View data"""
+    st.html(minify_css(GP_RESULTS_CSS))
 
-        div[data-testid="stSidebar"] label,
-        div[data-testid="stSidebar"] .stCheckbox > label {
-            font-size: 0.8rem;
-        }
-        div[data-testid="stSidebar"] h2,
-        div[data-testid="stSidebar"] h3 {
-            font-size: 1.1rem;
-        }
-    }
 
-    @media (max-width: 480px) {
-        div[data-testid="stSidebar"] .stButton > button {
-            font-size: 0.7rem;
-            padding: 0.3rem;
-            min-height: 32px;
-        }
-        div[data-testid="stSidebar"] .stTextInput > div > input,
-        div[data-testid="stSidebar"] .stNumberInput > div > input {
-            font-size: 0.7rem;
-            padding: 0.3rem;
-        }
-        div[data-testid="stSidebar"] .stSelectbox > div,
-        div[data-testid="stSidebar"] .stMultiSelect > div {
-            font-size: 0.7rem;
-        }
-        div[data-testid="stSidebar"] .stMarkdown,
-        div[data-testid="stSidebar"] label,
-        div[data-testid="stSidebar"] .stCheckbox > label {
-            font-size: 0.7rem;
-        }
-        div[data-testid="stSidebar"] h2,
-        div[data-testid="stSidebar"] h3 {
-            font-size: 1rem;
-        }
-    }
+initialize_session_state()
+inject_gp_css()
 
-    /* Accessibility improvements */
-    .stButton > button:focus,
-    .stTextInput > div > input:focus,
-    .stNumberInput > div > input:focus,
-    .stSelectbox > div:focus,
-    .stMultiSelect > div:focus {
-        outline: 2px solid var(--gp-primary);
-        outline-offset: 2px;
-    }
-    </style>
-""", unsafe_allow_html=True)
 def get_filtered_dataframe(df, filters, display_columns=None):
     filtered_df = df.copy()
     for key, value in filters.items():
@@ -2179,7 +1810,7 @@ def fetch_unique_values(column, dependent_filters, cache_key, _trigger):
         params = []
         
         # Process dependent filters
-        dropdown_columns = [k for k, v in STATIC_FILTERS.items() if v["type"] == "dropdown"]
+        dropdown_columns = get_filters_by_type("dropdown")
         
         for dep_col, dep_values in dependent_filters:
             # Handle special case filters
@@ -2272,7 +1903,16 @@ def fetch_unique_values(column, dependent_filters, cache_key, _trigger):
         return []
 
 @st.cache_data(ttl=CACHE_TTL, show_spinner=False)
-def fetch_filtered_data(filters, _cache_key, page_size, current_page, fetch_all=False):
+def fetch_filtered_count(count_query, params):
+    """Count records for a filtered query - cached so paging doesn't repeat the COUNT(*)"""
+    return execute_sql_query(count_query, params=params, operation_name="fetch_filtered_data_count", return_single_value=True)
+
+@st.cache_data(ttl=CACHE_TTL, max_entries=32, show_spinner=False)
+def fetch_filtered_data(filters, _cache_key, columns=None):
+    """Fetch every filtered record (up to MAX_RESULTS) and the total count - List View pages are sliced locally
+
+    columns optionally restricts the SELECT to a subset of logical column names (defaults to every column).
+    """
 
     try:
         logical_columns = [
@@ -2280,6 +1920,9 @@ def fetch_filtered_data(filters, _cache_key, page_size, current_page, fetch_all=
             "REVENUE", "NUMBER_OF_EMPLOYEES", "NUMBER_OF_LOCATIONS", "IS_B2B", "IS_B2C", "LONGITUDE", "LATITUDE", "FULL_ADDRESS", "WEBSITE", "IS_CURRENT_CUSTOMER", "DATA_AGG_UID", "PARENT_NAME", "PARENT_PHONE", "PARENT_WEBSITE",
             "TOP10_CONTACTS", "CONTACT_NATIONAL_DNC", "INTERNAL_DNC", "HAS_CONTACT_INFO"
             ]
+        if columns is not None:
+            # Only pull the requested columns across the wire
+            logical_columns = [col for col in logical_columns if col in columns]
         logical_to_actual = {"SIC_CODE": "SIC", "B2B": "IS_B2B", "B2C": "IS_B2C"}
         # All columns except TOP10_CONTACTS come from main table, TOP10_CONTACTS comes from tc
         columns = [
@@ -2383,23 +2026,35 @@ def fetch_filtered_data(filters, _cache_key, page_size, current_page, fetch_all=
         if st.session_state.get("filter_debug", False):
             st.write(f"**Debug - Total filters processed:** {len(filters)}")
             st.write(f"**Debug - WHERE clauses generated:** {len(where_clauses)}")
-        total_records = execute_sql_query(count_query, params=params, operation_name="fetch_filtered_data_count", return_single_value=True)
+        total_records = fetch_filtered_count(count_query, params)
         if "limit_warning" in st.session_state:
             del st.session_state["limit_warning"]
-        query += f" ORDER BY DBA_NAME"
+        # DATA_AGG_UID breaks DBA_NAME ties so row positions (used as selection / Salesforce IDs) are stable across queries
+        query += f" ORDER BY DBA_NAME, main.DATA_AGG_UID"
         if total_records > MAX_RESULTS:
             st.session_state["limit_warning"] = f"Result set contains {total_records} records, which exceeds the limit of {MAX_RESULTS}. Displaying the first {MAX_RESULTS} records."
             query += f" LIMIT {MAX_RESULTS}"
-            total_records = min(total_records, MAX_RESULTS)
-        elif not fetch_all:
-            offset = calculate_sql_offset(current_page, page_size)
-            query += f" LIMIT {page_size} OFFSET {offset}"
+            total_records = MAX_RESULTS
         df = execute_sql_query(query, params=params, operation_name="fetch_filtered_data")
         return df, total_records
     except Exception as e:
         show_error_message("Error fetching filtered data", f"{str(e)}\nQuery: {query}\nParams: {params}")
         return pd.DataFrame(), 0
 
+# Columns the map view reads (coordinates, tooltip fields, business card fields)
+MAP_COLUMNS = (
+    "LATITUDE", "LONGITUDE",
+    "DBA_NAME", "NUMBER_OF_EMPLOYEES", "NUMBER_OF_LOCATIONS", "REVENUE",
+    "ADDRESS", "CITY", "STATE", "ZIP", "PHONE", "WEBSITE", "PARENT_NAME", "PARENT_PHONE", "PARENT_WEBSITE",
+    "CONTACT_NAME", "CONTACT_EMAIL", "CONTACT_PHONE", "CONTACT_MOBILE", "CONTACT_JOB_TITLE", "DATA_AGG_UID",
+    "IS_CURRENT_CUSTOMER", "TOP10_CONTACTS", "INTERNAL_DNC", "CONTACT_NATIONAL_DNC"
+)
+
+def fetch_map_data(filters):
+    """Fetch all records for the map view, served from the fetch_filtered_data cache after the first call"""
+    cache_key = create_cache_key("map_data", filters)
+    return fetch_filtered_data(filters, cache_key, columns=MAP_COLUMNS)
+
 def display_filter_summary(filters):
     active_filters = []
     for column, value in filters.items():
@@ -2478,7 +2133,8 @@ def display_filter_summary(filters):
                 padding: 1.5rem;
                 text-align: center;
                 margin: 0.5rem 0;
-                transition: all 0.3s ease;
+                transition: 0.3s ease;
+                transition-property: border-color, box-shadow, transform;
             }
             
             .no-filters-container:hover {
@@ -2517,32 +2173,100 @@ def display_filter_summary(filters):
             """, unsafe_allow_html=True)
             
 def apply_b2b_b2c_filters(df, filters):
-    # B2B logic
-    b2b_choice = filters.get("B2B", "Include B2B & B2C")
-    if b2b_choice == "Exclude B2B":
-        df = df[df["IS_B2B"] == 0]
-    elif b2b_choice == "Only B2B":
-        df = df[df["IS_B2B"] == 1]
+    # B2B logic - "Only B2B" is the legacy spelling of "Show only B2B"
+    b2b_flag = {"Exclude B2B": 0, "Show only B2B": 1, "Only B2B": 1}.get(filters.get("B2B"))
+    if b2b_flag is not None:
+        df = df[df["IS_B2B"] == b2b_flag]
     # B2C logic
-    b2c_choice = filters.get("B2C", "Include B2B & B2C")
-    if b2c_choice == "Exclude B2C":
-        df = df[df["IS_B2C"] == 0]
-    elif b2c_choice == "Only B2C":
-        df = df[df["IS_B2C"] == 1]
+    b2c_flag = {"Exclude B2C": 0, "Show only B2C": 1, "Only B2C": 1}.get(filters.get("B2C"))
+    if b2c_flag is not None:
+        df = df[df["IS_B2C"] == b2c_flag]
     return df
 
 def add_businesses_to_salesforce(business_df):
 
     if business_df.empty:
         return 0
-    business_ids = business_df.index.tolist()
-    newly_added = 0
-    
-    for business_id in business_ids:
-        if add_business_to_salesforce(business_id):
-            newly_added += 1
+    # One set difference over the string IDs instead of a per-row add (first occurrence order kept)
+    # Dedupe on the raw index first so only unique IDs are stringified and probed
+    business_ids = business_df.index.unique().astype(str)
+    tracked_ids = get_sf_business_id_set()
+    new_ids = business_ids[~business_ids.isin(tracked_ids)].to_numpy()
+    if not new_ids.size:
+        return 0
     
-    return newly_added
+    track_sf_business_ids(new_ids)
+    return len(new_ids)
+
+# Sidebar filter styling - expandable sections, compact buttons and inputs
+SIDEBAR_FILTER_CSS = """
+    <style>
+    /* Button styling improvements - keep it simple and targeted */
+    .stButton > button {
+        width: 100% !important;
+        padding: 0.5rem !important;
+        border-radius: 6px !important;
+        font-size: 0.9rem !important;
+        min-height: 40px !important;
+        font-weight: 500 !important;
+        transition: 0.2s ease !important;
+        transition-property: background-color, border-color, box-shadow, transform !important;
+    }
+
+    /* Primary button styling */
+    .stButton > button[kind="primary"] {
+        background-color: #262aff !important;
+        color: white !important;
+        border: none !important;
+    }
+
+    /* Secondary button styling */
+    .stButton > button[kind="secondary"] {
+        background-color: #ffffff !important;
+        color: #1a1b23 !important;
+        border: 2px solid #e6e9f3 !important;
+    }
+
+    /* Hover effects */
+    .stButton > button[kind="primary"]:hover {
+        background-color: #1b1c6e !important;
+        transform: translateY(-1px) !important;
+    }
+
+    .stButton > button[kind="secondary"]:hover {
+        background-color: #f0f2f7 !important;
+        border-color: #2e3748 !important;
+    }
+
+    /* Disabled state */
+    .stButton > button:disabled {
+        opacity: 0.5 !important;
+        cursor: not-allowed !important;
+        transform: none !important;
+    }
+
+    /* Input field styling */
+    div[data-testid="stSidebar"] .stTextInput > div > input,
+    div[data-testid="stSidebar"] .stNumberInput > div > input {
+        border-radius: 6px !important;
+        font-size: 0.85rem !important;
+    }
+
+    /* Expander styling */
+    .streamlit-expanderHeader {
+        background-color: var(--gp-haze) !important;
+        border-radius: 6px !important;
+        font-weight: 500 !important;
+        padding: 8px 12px !important;
+        margin-bottom: 0.5rem !important;
+    }
+
+    /* Add spacing between expanders */
+    .streamlit-expander {
+        margin-bottom: 1rem !important;
+    }
+    </style>
+"""
 
 def create_sidebar_filters():
     def generate_text_filter(column, config, placeholder=None):
@@ -2643,7 +2367,7 @@ def create_sidebar_filters():
 
     filters = {}
     filter_columns = list(STATIC_FILTERS.keys())
-    dropdown_columns = [k for k, v in STATIC_FILTERS.items() if v["type"] == "dropdown"]
+    dropdown_columns = get_filters_by_type("dropdown")
     
     if not st.session_state["sidebar_collapsed"]:
         with st.sidebar:
@@ -2665,7 +2389,7 @@ def create_sidebar_filters():
             if has_contact_info != st.session_state.get("has_contact_info", contact_info_options[0]):
                 st.session_state["has_contact_info"] = has_contact_info
                 # Trigger update for ALL dropdown filters since they ALL depend on contact info
-                all_dropdown_filters = [k for k, v in STATIC_FILTERS.items() if v["type"] == "dropdown"]
+                all_dropdown_filters = get_filters_by_type("dropdown")
                 for col in all_dropdown_filters:
                     if col in st.session_state.get("filter_update_trigger", {}):
                         st.session_state["filter_update_trigger"][col] += 1
@@ -2682,83 +2406,17 @@ def create_sidebar_filters():
                 st.write(f"- Filter Value: {filters['HAS_CONTACT_INFO']}")
                 st.write("**All Active Filters:**")
                 for k, v in filters.items():
-                    if k != 'HAS_CONTACT_INFO' and v and v != [] and v != [None, None]:
-                        st.write(f"- {k}: {v}")
-                st.write("**Filter Update Triggers:**")
-                for k, v in st.session_state.get('filter_update_trigger', {}).items():
-                    st.write(f"- {k}: {v}")
-                st.write("**Session State Filters:**")
-                for k, v in st.session_state.get('filters', {}).items():
-                    if v and v != [] and v != [None, None]:
-                        st.write(f"- {k}: {v}")
-            # Enhanced CSS for the expandable sections design
-            st.markdown("""
-                <style>
-                /* Button styling improvements - keep it simple and targeted */
-                .stButton > button {
-                    width: 100% !important;
-                    padding: 0.5rem !important;
-                    border-radius: 6px !important;
-                    font-size: 0.9rem !important;
-                    min-height: 40px !important;
-                    font-weight: 500 !important;
-                    transition: all 0.2s ease !important;
-                }
-                
-                /* Primary button styling */
-                .stButton > button[kind="primary"] {
-                    background-color: #262aff !important;
-                    color: white !important;
-                    border: none !important;
-                }
-                
-                /* Secondary button styling */
-                .stButton > button[kind="secondary"] {
-                    background-color: #ffffff !important;
-                    color: #1a1b23 !important;
-                    border: 2px solid #e6e9f3 !important;
-                }
-                
-                /* Hover effects */
-                .stButton > button[kind="primary"]:hover {
-                    background-color: #1b1c6e !important;
-                    transform: translateY(-1px) !important;
-                }
-                
-                .stButton > button[kind="secondary"]:hover {
-                    background-color: #f0f2f7 !important;
-                    border-color: #2e3748 !important;
-                }
-                
-                /* Disabled state */
-                .stButton > button:disabled {
-                    opacity: 0.5 !important;
-                    cursor: not-allowed !important;
-                    transform: none !important;
-                }
-                
-                /* Input field styling */
-                div[data-testid="stSidebar"] .stTextInput > div > input,
-                div[data-testid="stSidebar"] .stNumberInput > div > input {
-                    border-radius: 6px !important;
-                    font-size: 0.85rem !important;
-                }
-                
-                /* Expander styling */
-                .streamlit-expanderHeader {
-                    background-color: var(--gp-haze) !important;
-                    border-radius: 6px !important;
-                    font-weight: 500 !important;
-                    padding: 8px 12px !important;
-                    margin-bottom: 0.5rem !important;
-                }
-                
-                /* Add spacing between expanders */
-                .streamlit-expander {
-                    margin-bottom: 1rem !important;
-                }
-                </style>
-            """, unsafe_allow_html=True)
+                    if k != 'HAS_CONTACT_INFO' and v and v != [] and v != [None, None]:
+                        st.write(f"- {k}: {v}")
+                st.write("**Filter Update Triggers:**")
+                for k, v in st.session_state.get('filter_update_trigger', {}).items():
+                    st.write(f"- {k}: {v}")
+                st.write("**Session State Filters:**")
+                for k, v in st.session_state.get('filters', {}).items():
+                    if v and v != [] and v != [None, None]:
+                        st.write(f"- {k}: {v}")
+            # Enhanced CSS for the expandable sections design
+            st.html(minify_css(SIDEBAR_FILTER_CSS))
             
             # Location Filters Expander
             with st.expander("Location", expanded=True):
@@ -2793,7 +2451,7 @@ def create_sidebar_filters():
                 if new_location_filter != current_location_filter:
                     st.session_state["filters"]["LOCATION_RADIUS"] = new_location_filter
                     # Trigger dropdown filter updates since location affects available options
-                    all_dropdown_filters = [k for k, v in STATIC_FILTERS.items() if v["type"] == "dropdown"]
+                    all_dropdown_filters = get_filters_by_type("dropdown")
                     for col in all_dropdown_filters:
                         if col in st.session_state.get("filter_update_trigger", {}):
                             st.session_state["filter_update_trigger"][col] += 1
@@ -2946,7 +2604,7 @@ def create_sidebar_filters():
                 st.session_state["total_records"] = 0
                 st.session_state["confirm_delete_search"] = False
                 st.session_state["search_to_delete"] = None
-                st.session_state["filter_update_trigger"] = {col: 0 for col in STATIC_FILTERS if STATIC_FILTERS[col]["type"] == "dropdown"}
+                st.session_state["filter_update_trigger"] = {col: 0 for col in FILTERS_BY_TYPE["dropdown"]}
                 st.session_state["search_name"] = ""
                 st.session_state["selected_search"] = ""
                 st.session_state["reset_sidebar_cortex_prompt"] = True
@@ -3112,6 +2770,18 @@ def format_phone_for_link(value):
         # For international or non-standard formats, just prepend tel:
         return f"tel:{phone}" if phone else None
 
+def format_phone_series_for_link(values):
+    """Vectorized format_phone_for_link for a whole column"""
+    text = values.astype("string").str.strip()
+    digits = text.str.replace(r"\D", "", regex=True)
+    length = digits.str.len()
+    links = ("tel:" + digits).where(length > 0)
+    links = links.mask((length == PHONE_LENGTH_WITH_COUNTRY) & digits.str.startswith("1"), "tel:+" + digits)
+    links = links.mask(length == PHONE_LENGTH_STANDARD, "tel:+1" + digits)
+    invalid = values.isna() | values.eq(0) | text.isin(['-', '', 'nan', 'None'])
+    links = links.mask(invalid).astype(object)
+    return links.where(links.notna(), None)
+
 def format_address_for_link(address_parts):
 
     if not address_parts:
@@ -3124,24 +2794,6 @@ def format_address_for_link(address_parts):
     # Create map app URL (works with Apple Maps, Google Maps, and other map apps)
     return f"maps:q={encoded_address}"
 
-def format_currency(value):
-    """Format currency values for display"""
-    if pd.isna(value):
-        return "-"
-    return f"${value:,.2f}"
-
-def format_number(value):
-    """Format numeric values for display"""
-    if pd.isna(value):
-        return "-"
-    return f"{value:,.0f}"
-
-def format_zip(value):
-    """Format ZIP codes for display"""
-    if pd.isna(value):
-        return "-"
-    return str(value).strip()
-
 def format_phone(value):
     """Format phone numbers for display in data tables"""
     if pd.isna(value):
@@ -3163,6 +2815,12 @@ def format_email_for_link(email):
         return f"mailto:{email_str}"
     return None
 
+def format_email_series_for_link(values):
+    """Vectorized format_email_for_link for a whole column"""
+    text = values.astype("string").str.strip()
+    links = ("mailto:" + text).where(text.str.contains("@", regex=False).fillna(False)).astype(object)
+    return links.where(links.notna(), None)
+
 def extract_address_parts(row):
     """Extract address components from a dataframe row"""
     address_parts = []
@@ -3176,20 +2834,6 @@ def extract_address_parts(row):
         address_parts.append(str(row['ZIP']))
     return address_parts
 
-def create_address_link(row):
-    """Create a clickable map link for an address"""
-    address_parts = extract_address_parts(row)
-    return format_address_for_link(address_parts) if address_parts else None
-
-def create_full_address(row):
-    """Create a full address string from address components"""
-    address_parts = extract_address_parts(row)
-    return ', '.join(address_parts) if address_parts else "-"
-
-def format_contact_name(value):
-    """Format contact names for display"""
-    return str(value).strip() if pd.notna(value) else "-"
-
 def is_valid_value(value):
     """Check if a value is not null, empty, or 'nan' string"""
     return pd.notna(value) and str(value).strip() not in ['None', '', 'nan']
@@ -3202,6 +2846,12 @@ def get_sf_business_ids():
     """Get the list of Salesforce business IDs from session state"""
     return st.session_state.get("sf_business_ids", [])
 
+def get_sf_business_id_set():
+    """Get the set of Salesforce business IDs from session state, rebuilt from the list if missing"""
+    if "sf_business_id_set" not in st.session_state:
+        st.session_state["sf_business_id_set"] = set(get_sf_business_ids())
+    return st.session_state["sf_business_id_set"]
+
 def get_load_search_counter():
     """Get the load search counter from session state"""
     return st.session_state.get('load_search_counter', 0)
@@ -3547,20 +3197,47 @@ def get_disabled_columns():
         "TOP10_CONTACTS", "CONTACT_NATIONAL_DNC", "INTERNAL_DNC"
     ]
 
-def get_dataframe_format_config():
-    """Get standardized formatting configuration for styled dataframes"""
-    return {
-        "REVENUE": format_currency,
-        "NUMBER_OF_EMPLOYEES": format_number,
-        "NUMBER_OF_LOCATIONS": format_number,
-        "ZIP": format_zip,
-        "PHONE": format_phone,
-        "CONTACT_PHONE": format_phone,
-        "CONTACT_NAME": format_contact_name,
-        "CONTACT_MOBILE": format_phone,
-        "PARENT_PHONE": format_phone,
-        
-    }
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def format_page_for_display(display_df):
+    """Format one page of results for the data editor (links, addresses, column order)"""
+    # Drop columns the editor never shows before any formatter pass (drop returns a new frame)
+    is_current_customer = display_df.get('IS_CURRENT_CUSTOMER')
+    display_df = display_df.drop(columns=['LONGITUDE', 'LATITUDE', 'IS_CURRENT_CUSTOMER'], errors='ignore')
+    
+    # Initialize Map and SF columns with their default states
+    display_df['Map'] = True  # Default value for Map column
+    display_df['SF'] = False  # Default value for SF column
+    
+    # Create Current Customer column based on IS_CURRENT_CUSTOMER field
+    if is_current_customer is not None:
+        # eq(True) matches the old `x is True or x == True` check (True, 1, 1.0) without a Python lambda per row
+        display_df['Current Customer'] = np.where(is_current_customer.eq(True), "🔵", "⚪")
+    else:
+        display_df['Current Customer'] = "⚪"
+    # Format URLs to ensure they are absolute URLs
+    if 'WEBSITE' in display_df.columns:
+        display_df['WEBSITE'] = display_df['WEBSITE'].apply(format_url)
+    if 'PARENT_WEBSITE' in display_df.columns:
+        display_df['PARENT_WEBSITE'] = display_df['PARENT_WEBSITE'].apply(format_url)
+    
+    # Create a combined address column for Google Maps links
+    address_cols = ['ADDRESS', 'CITY', 'STATE', 'ZIP']
+    if all(col in display_df.columns for col in address_cols):
+        # Extract address parts once per row, touching only the four address columns
+        address_parts = [extract_address_parts(row) for row in display_df[address_cols].to_dict("records")]
+        display_df['ADDRESS_LINK'] = [format_address_for_link(parts) if parts else None for parts in address_parts]
+        display_df['FULL_ADDRESS'] = [', '.join(parts) if parts else "-" for parts in address_parts]
+    
+    # Single reorder into the editor layout (drops the individual address fields)
+    display_df = display_df.reindex(columns=FINAL_COLUMN_ORDER, fill_value="")
+    
+    # Format phone numbers for clickable tel: links (vectorized .str passes, no per-cell Python calls)
+    for phone_col in ('PHONE', 'CONTACT_PHONE', 'CONTACT_MOBILE', 'PARENT_PHONE'):
+        display_df[phone_col] = format_phone_series_for_link(display_df[phone_col])
+    # Format email addresses for clickable mailto: links
+    display_df['CONTACT_EMAIL'] = format_email_series_for_link(display_df['CONTACT_EMAIL'])
+    
+    return display_df
 
 def calculate_pagination_values(total_records, page_size, current_page):
     """Calculate pagination values including total pages, start/end indices, and validated current page"""
@@ -3580,10 +3257,6 @@ def reset_to_first_page():
     """Reset pagination to first page"""
     st.session_state["current_page"] = 1
 
-def calculate_sql_offset(current_page, page_size):
-    """Calculate SQL OFFSET value for pagination"""
-    return (current_page - 1) * page_size
-
 def init_session_state_key(key, default_value):
     """Initialize session state key if it doesn't exist"""
     if key not in st.session_state:
@@ -3599,10 +3272,28 @@ def update_filter_triggers(columns_to_update, exclude_column=None):
         if exclude_column is None or col != exclude_column:
             st.session_state["filter_update_trigger"][col] += 1
 
-def refresh_data_editor_and_rerun():
-    """Refresh data editor and trigger rerun"""
+def refresh_data_editor():
+    """Refresh data editor on the next script run"""
     st.session_state["data_editor_refresh_counter"] += 1
-    st.rerun()
+
+def on_page_size_change():
+    """Apply the selected page size and return to the first page"""
+    st.session_state["page_size"] = st.session_state["page_size_selector"]
+    reset_to_first_page()
+    # Force data editor refresh but don't fetch new data - it's already loaded
+    refresh_data_editor()
+
+def on_page_change():
+    """Apply the page chosen in the page selector"""
+    st.session_state["current_page"] = st.session_state["page_selector"]
+    # Force data editor refresh but don't fetch new data - it's already loaded
+    refresh_data_editor()
+
+def go_to_page(page):
+    """Move to the given page (used by Previous/Next buttons)"""
+    st.session_state["current_page"] = page
+    # Force data editor refresh but don't fetch new data
+    refresh_data_editor()
 
 def create_html_wrapper(tag, css_class, content="", close_tag=True):
     """Create HTML wrapper with optional content"""
@@ -3626,52 +3317,43 @@ def close_html_wrapper(tag, comment=""):
     st.markdown(f'</{tag}>', unsafe_allow_html=True)
 
 def create_page_size_selector():
-    """Create and handle page size selector widget"""
-    new_page_size = st.selectbox(
+    """Create page size selector widget"""
+    st.selectbox(
         "Show",
         options=PAGE_SIZE_OPTIONS,
         index=PAGE_SIZE_OPTIONS.index(st.session_state["page_size"]),
         key="page_size_selector",
-        label_visibility="visible"
+        label_visibility="visible",
+        on_change=on_page_size_change
     )
-    if new_page_size != st.session_state["page_size"]:
-        st.session_state["page_size"] = new_page_size
-        reset_to_first_page()
-        # Force data editor refresh but don't fetch new data - it's already loaded
-        refresh_data_editor_and_rerun()
 
 def create_page_selector(total_pages):
-    """Create and handle page selector widget"""
+    """Create page selector widget"""
     page_options = list(range(1, total_pages + 1))
-    new_page = st.selectbox(
+    st.selectbox(
         "Page",
         options=page_options,
         index=st.session_state["current_page"] - 1,
-        key="page_selector"
+        key="page_selector",
+        on_change=on_page_change
     )
-    if new_page != st.session_state["current_page"]:
-        st.session_state["current_page"] = new_page
-        # Force data editor refresh but don't fetch new data - it's already loaded
-        refresh_data_editor_and_rerun()
 
 def create_pagination_navigation_buttons(total_pages):
-    """Create and handle pagination navigation buttons (Previous/Next)"""
-    btn_col1, btn_col2 = create_equal_columns()
+    """Create pagination navigation buttons (Previous/Next)"""
+    cp = st.session_state["current_page"]
+    btn_col1, btn_col2 = st.columns(2)
     with btn_col1:
-        if st.button(":material/skip_previous:", disabled=st.session_state["current_page"] == 1, key="prev_page", use_container_width=True, help="Previous page"):
-            st.session_state["current_page"] -= 1
-            # Force data editor refresh but don't fetch new data
-            refresh_data_editor_and_rerun()
+        st.button(":material/skip_previous:", disabled=cp == 1, key="prev_page", use_container_width=True, help="Previous page",
+                  on_click=go_to_page, args=(cp - 1,))
     with btn_col2:
-        if st.button(":material/skip_next:", disabled=bool(st.session_state["current_page"] == total_pages), key="next_page", use_container_width=True, help="Next page"):
-            st.session_state["current_page"] += 1
-            # Force data editor refresh but don't fetch new data
-            refresh_data_editor_and_rerun()
+        st.button(":material/skip_next:", disabled=cp == total_pages, key="next_page", use_container_width=True, help="Next page",
+                  on_click=go_to_page, args=(cp + 1,))
 
 def display_pagination_status(start_idx, end_idx, total_records, total_pages):
     """Display pagination status information"""
+    cp = st.session_state["current_page"]
     display_html_wrapper("div", "pagination-status")
-    st.caption(f"Viewing {start_idx + 1}–{end_idx} of {total_records} records (Page {st.session_state['current_page']} of {total_pages})")
+    st.caption(f"Viewing {start_idx + 1}–{end_idx} of {total_records} records (Page {cp} of {total_pages})")
     close_html_wrapper("div")
 
 def create_complete_pagination_ui(total_records, total_pages, start_idx, end_idx):
@@ -3679,10 +3361,10 @@ def create_complete_pagination_ui(total_records, total_pages, start_idx, end_idx
     display_html_wrapper("div", "page-navigation-container")
     
     # Top row - Page size and page selector
-    col_left, col_right = create_two_column_layout([3, 2])
+    col_left, col_right = st.columns((3, 2))
     with col_left:
         display_html_wrapper("div", "page-size-controls")
-        sub_col1, sub_col2 = create_equal_columns()
+        sub_col1, sub_col2 = st.columns(2)
         with sub_col1:
             create_page_size_selector()
         with sub_col2:
@@ -3696,6 +3378,161 @@ def create_complete_pagination_ui(total_records, total_pages, start_idx, end_idx
     display_pagination_status(start_idx, end_idx, total_records, total_pages)
     close_html_wrapper("div")  # Close page-navigation-container
 
+# Keeps primary button labels (e.g. "Send Selected to Salesforce") on one line
+NOWRAP_PRIMARY_BUTTON_CSS = """
+<style>
+button[kind="primary"] span {
+    white-space: nowrap !important;
+    overflow: visible !important;
+}
+</style>
+"""
+
+# Data editor / table styling for the List View
+GP_TABLE_CSS = """
+    <style>
+    /* Global Payments Data Visualization Styling - Consolidated */
+    .stDataEditor, .stDataFrame {
+        font-family: "DM Sans", -apple-system, BlinkMacSystemFont, sans-serif !important;
+    }
+    
+    .stDataEditor > div, .stDataFrame > div {
+        border-radius: 12px !important;
+        overflow: hidden !important;
+        box-shadow: 0 4px 20px rgba(38, 42, 255, 0.08) !important;
+        border: 1px solid #e6e9f3 !important;
+    }
+    
+    /* Header styling with Global Blue gradient */
+    .stDataEditor thead th, .stDataFrame thead th {
+        background: linear-gradient(135deg, #262aff 0%, #4da8da 100%) !important;
+        color: white !important;
+        font-weight: 600 !important;
+        padding: 12px 16px !important;
+        border: none !important;
+        font-size: 12px !important;
+        text-transform: uppercase !important;
+        letter-spacing: 0.5px !important;
+    }
+    
+    /* Row and cell styling */
+    .stDataEditor tbody tr:hover, .stDataFrame tbody tr:hover {
+        transform: translateY(-1px) !important;
+        box-shadow: 0 6px 24px rgba(38, 42, 255, 0.15) !important;
+        transition: 0.2s ease !important;
+        transition-property: box-shadow, transform !important;
+    }
+    
+    .stDataEditor td, .stDataFrame td {
+        border: none !important;
+        padding: 2px !important;
+    }
+    
+    /* Accent lines for visual grouping */
+    .stDataEditor tbody tr:nth-child(5n+1) td:first-child::before, 
+    .stDataFrame tbody tr:nth-child(5n+1) td:first-child::before {
+        content: '';
+        position: absolute;
+        left: 0;
+        top: 0;
+        height: 100%;
+        width: 3px;
+        background: linear-gradient(45deg, #262aff 0%, #4da8da 100%);
+        border-radius: 0 2px 2px 0;
+    }
+    
+    /* Scrollbar styling */
+    .stDataEditor ::-webkit-scrollbar, .stDataFrame ::-webkit-scrollbar {
+        width: 8px;
+        height: 8px;
+    }
+    
+    .stDataEditor ::-webkit-scrollbar-track, .stDataFrame ::-webkit-scrollbar-track {
+        background: #f1f5f9;
+        border-radius: 4px;
+    }
+    
+    .stDataEditor ::-webkit-scrollbar-thumb, .stDataFrame ::-webkit-scrollbar-thumb {
+        background: linear-gradient(135deg, #262aff 0%, #4da8da 100%);
+        border-radius: 4px;
+    }
+    
+    .stDataEditor ::-webkit-scrollbar-thumb:hover, .stDataFrame ::-webkit-scrollbar-thumb:hover {
+        background: linear-gradient(135deg, #1b1c6e 0%, #2d5a87 100%);
+    }
+    
+    /* Link styling - consolidated for all link types */
+    .stDataEditor a, .stDataFrame a {
+        color: #262aff !important;
+        text-decoration: none !important;
+        font-weight: 500 !important;
+    }
+    
+    .stDataEditor a:hover, .stDataFrame a:hover {
+        color: #1b1c6e !important;
+        text-decoration: underline !important;
+    }
+    
+    /* Link icons */
+    .stDataEditor a[href^="tel:"]::before, .stDataFrame a[href^="tel:"]::before {
+        content: "📞 ";
+        font-size: 0.9em;
+        margin-right: 4px;
+    }
+    
+    .stDataEditor a[href^="mailto:"]::before, .stDataFrame a[href^="mailto:"]::before {
+        content: "📧 ";
+        font-size: 0.9em;
+        margin-right: 4px;
+    }
+    
+    /* Success message styling - minimal and compact */
+    .element-container:has(.stSuccess) {
+        margin: -20px 0 !important;
+        height: auto !important;
+        min-height: 0 !important;
+    }
+    
+    .stSuccess {
+        padding: 0 !important;
+        min-height: 0 !important;
+        height: auto !important;
+        background: transparent !important;
+        border: none !important;
+        box-shadow: none !important;
+    }
+    
+    .stSuccess > div {
+        padding: 0 !important;
+        min-height: 0 !important;
+        height: auto !important;
+    }
+    
+    .stSuccess p {
+        font-size: 8px !important;
+        padding: 0 !important;
+        white-space: nowrap !important;
+        margin: 0 !important;
+        color: #0c8a15 !important;
+        font-weight: 500 !important;
+    }
+    
+    .stSuccess svg {
+        display: none !important;
+    }
+    
+    .salesforce-section {
+        margin: 15px 0 20px 0;
+        border-top: 1px solid #f0f2f7;
+        padding-top: 10px;
+    }
+    </style>
+"""
+
+def inject_gp_table_css():
+    """Emit the List View table CSS (must run on every rerun - Streamlit drops elements a run doesn't re-emit)"""
+    st.html(minify_css(GP_TABLE_CSS))
+
 def create_tooltip_style(is_dark_map=False):
     """Generate tooltip styling based on map theme - light tooltip for dark maps, dark tooltip for light maps"""
     if is_dark_map:
@@ -3757,15 +3594,192 @@ def create_tooltip_header_style(is_dark_map=False):
             align-items: center;
             gap: 6px;
         """
-def create_two_column_layout(ratio=[1, 1]):
+
+def render_map_tooltip(business_data, tooltip_style, header_style, section_color):
+    """Render the HTML tooltip for a single map point"""
+    content_html = ""
+    for section_title, items in build_tooltip_sections(business_data):
+        if items:
+            items_html = "".join(f"<div style='display: flex; align-items: center; gap: 10px; margin-bottom: 6px;'><span style='font-size: 16px;'>{item}</span></div>" for item in items)
+            content_html += f"""
+                <div style='margin-bottom: 16px;'>
+                    <div style='color: {section_color}; font-weight: 700; font-size: 15px; margin-bottom: 6px; text-transform: uppercase; letter-spacing: 1px;'>{section_title}</div>
+                    {items_html}
+                </div>
+            """
+
+    # Larger tooltip container and header
+    return f"""
+        <div style='{tooltip_style}; min-width: 340px; max-width: 480px; padding: 18px 22px; font-size: 16px;'>
+            <div style='{header_style}; padding-bottom: 10px;'>
+                <span style='background: rgba(255, 255, 255, 0.2); width: 32px; height: 32px; display: inline-flex; align-items: center; justify-content: center; border-radius: 8px; font-size: 22px;'>🏢</span>
+                <span style='font-size: 22px; font-weight: 700; line-height: 1.2; margin-left: 10px;'>{business_data['DBA_NAME']}</span>
+            </div>
+            <div style='padding: 6px 0;'>
+                {content_html}
+            </div>
+        </div>
+    """
+
+def render_compact_map_tooltip(business_name, address_str, tooltip_style, header_style):
+    """Render the lightweight name/address tooltip used for non-selected map points"""
+    address_html = f"<div style='padding: 6px 0; font-size: 14px;'>📍 {address_str}</div>" if address_str else ""
+    return f"""
+        <div style='{tooltip_style}; min-width: 240px; max-width: 480px; padding: 14px 18px; font-size: 14px;'>
+            <div style='{header_style}; padding-bottom: 8px;'>
+                <span style='font-size: 18px; font-weight: 700; line-height: 1.2;'>🏢 {business_name}</span>
+            </div>
+            {address_html}
+        </div>
+    """
+
+def build_map_tooltips(map_data, is_dark_map=False, detailed_indices=()):
+    """Build tooltip HTML for every map point - full sections only for detailed_indices, a compact summary otherwise"""
+    tooltip_style = create_tooltip_style(is_dark_map)
+    header_style = create_tooltip_header_style(is_dark_map)
+    section_color = "#81c5f4" if is_dark_map else "#4da8da"
+    # Full records are only materialized for the few detailed rows, in one .loc/to_dict pass
+    detailed_labels = [idx for idx in dict.fromkeys(detailed_indices) if idx in map_data.index]
+    detailed_html = {
+        idx: render_map_tooltip(record, tooltip_style, header_style, section_color)
+        for idx, record in zip(detailed_labels, map_data.loc[detailed_labels].to_dict("records"))
+    }
+    # Compact tooltips read pre-extracted column lists instead of building a record per row
+    address_cols = [col for col in ("ADDRESS", "CITY", "STATE", "ZIP") if col in map_data.columns]
+    if address_cols:
+        address_strs = [
+            ', '.join(str(part) for part in parts if is_valid_value(part))
+            for parts in zip(*(map_data[col].tolist() for col in address_cols))
+        ]
+    else:
+        address_strs = [""] * len(map_data)
+    return [
+        detailed_html[idx] if idx in detailed_html
+        else render_compact_map_tooltip(name, address_str, tooltip_style, header_style)
+        for idx, name, address_str in zip(map_data.index, map_data["DBA_NAME"].tolist(), address_strs)
+    ]
+
+def normalize_map_flag_columns(map_data):
+    """Convert IS_CURRENT_CUSTOMER to bool and INTERNAL_DNC to an int8 0/1 flag (True, 1, "true", "1" -> 1)"""
+    flag_columns = {}
+    if 'IS_CURRENT_CUSTOMER' in map_data.columns:
+        flag_columns['IS_CURRENT_CUSTOMER'] = map_data['IS_CURRENT_CUSTOMER'].eq(True)
+    if 'INTERNAL_DNC' in map_data.columns:
+        dnc = map_data['INTERNAL_DNC']
+        is_dnc = dnc.eq(True) | dnc.astype(str).str.strip().str.lower().isin(["true", "1"])
+        flag_columns['INTERNAL_DNC'] = is_dnc.astype("int8")
+    return map_data.assign(**flag_columns)
+
+NON_SELECTED_POINT_COLOR_DARK_MAP = [173, 216, 255, 100]  # Light Sky Blue (lighter derivative of Global Blue palette)
+NON_SELECTED_POINT_COLORS = {  # Non-selected point color by map style (dark_mode/satellite_alt fall back to the dark map color)
+    ":material/light_mode:": [27, 30, 198, 100],  # Global Payments Deep Blue
+    ":material/terrain:": [27, 30, 198, 100],  # Global Payments Deep Blue
+}
+CURRENT_CUSTOMER_POINT_COLOR = [244, 54, 76, 200]  # Global Raspberry - overrides every other map point color
+SELECTED_POINT_COLORS = np.array([  # Selected business colors (Global Payments tertiary palette), by selection order
+    [38, 42, 255, 200],     # Global Blue
+    [255, 204, 0, 200],     # Sunshine
+    [253, 160, 82, 200],    # Creamsicle
+    [135, 23, 157, 200],    # Grape
+    [28, 171, 255, 200],    # Pulse Blue
+], dtype=np.uint8)
+
+def build_map_point_colors(df, base_color):
+    """Build the RGBA fill color for every map point in one NumPy pass (current customers use Global Raspberry)
+
+    base_color is either a single RGBA color or one RGBA row per point.
+    """
+    colors = np.array(np.broadcast_to(np.asarray(base_color, dtype=np.uint8), (len(df), 4)))
+    if 'IS_CURRENT_CUSTOMER' in df.columns:
+        colors[df['IS_CURRENT_CUSTOMER'].eq(True).to_numpy()] = CURRENT_CUSTOMER_POINT_COLOR
+    # pydeck serializes to JSON, so hand it plain lists of ints
+    return colors.tolist()
+
+LAYER_DATA_COLUMNS = ["lon", "lat", "tooltip"]  # Fields the map layers and the {tooltip} template read
+
+def build_layer_data(df, base_color):
+    """Project map rows to the payload pydeck serializes for a layer: position, tooltip and fill_color"""
+    return df[LAYER_DATA_COLUMNS].assign(fill_color=build_map_point_colors(df, base_color))
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def compute_map_viewport(lats, lons):
+    """Compute the initial map center, zoom and point radius that fit all displayed points"""
+    coords = np.column_stack((np.asarray(lats, dtype=float), np.asarray(lons, dtype=float)))
+    min_lat, min_lon = coords.min(axis=0)
+    max_lat, max_lon = coords.max(axis=0)
+    center_lat = float(min_lat + max_lat) / 2
+    center_lon = float(min_lon + max_lon) / 2
+    lat_diff = float(max_lat - min_lat)
+    lon_diff = float(max_lon - min_lon)
+    
+    # Add padding buffer for better visibility, especially with few points
+    padding_factor = 0.3  # 30% padding around the points
+    lat_diff = max(lat_diff, 0.01) + (lat_diff * padding_factor)  # Minimum diff for very close points
+    lon_diff = max(lon_diff, 0.01) + (lon_diff * padding_factor)
+    
+    if lat_diff == 0 or lon_diff == 0:
+        default_zoom = DEFAULT_MAP_ZOOM  # Reduced from 11 for better initial view
+        initial_radius = 200
+    else:
+        lat_zoom = LAT_ZOOM_BASE - math.log2(lat_diff)
+        lon_zoom = LON_ZOOM_BASE - math.log2(lon_diff * math.cos(math.radians(center_lat)))
+        # Reduced zoom calculation for better visibility with few points
+        default_zoom = min(lat_zoom, lon_zoom) - 2  # Changed from -1 to -2 for more zoom out
+        
+        # Special handling for small number of points
+        if len(coords) <= 3:
+            default_zoom = min(default_zoom, 10)  # Cap zoom for few points
+        
+        default_zoom = max(2, min(15, round(default_zoom)))
+        initial_radius = max(50, 500000 / (2 ** default_zoom))
+    return center_lat, center_lon, default_zoom, initial_radius
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def build_business_lookups(uids, names, indices):
+    """Build the map multiselect options plus UID -> index, UID -> label and index -> UID lookups"""
+    dba_names = pd.Series(names, dtype=object)
+    # Assign a display number for each duplicate DBA_NAME - only add [n] if there are duplicates
+    is_duplicate_name = dba_names.duplicated(keep=False)
+    display_numbers = dba_names.groupby(dba_names, dropna=False, sort=False).cumcount() + 1
+    labels = dba_names.where(~is_duplicate_name, dba_names.astype(str) + " [" + display_numbers.astype(str) + "]")
+    return list(uids), dict(zip(uids, indices)), dict(zip(uids, labels)), dict(zip(indices, uids))
+
+@st.cache_data(ttl=CACHE_TTL, show_spinner=False)
+def render_business_card_html(card_fields, already_pushed):
+    """Build the map business card HTML from (field, value) pairs and the Salesforce push status"""
+    business_data = dict(card_fields)
+
+    # Add INTERNAL_DNC flag if needed
+    dnc_flag = ''
+    dnc_val = business_data.get("INTERNAL_DNC")
+    if dnc_val == 1:
+        dnc_flag = '<span style="color:red; font-weight:bold; font-size:1.1em; margin-left:12px;">🚫 INTERNAL DNC</span>'
+
+    # Build header
+    sf_status = '<span class="sf-push-status">✓ Pushed to Salesforce</span>' if already_pushed else ''
+    header = f'<h3><div class="business-name-container">{business_data["DBA_NAME"]}{dnc_flag}</div>{sf_status}</h3>'
+    
+    # Build sections using consolidated helper
+    sections = build_business_card_sections(business_data)
+    
+    return f'''<div class="business-details-card">{header}<div class="business-data-dashboard">{"".join(sections)}</div></div>'''
+
+def format_business_data_html(business_data, sf_ids):
+    """Generate business card HTML for a map record dict, given the set of IDs already pushed to Salesforce"""
+    already_pushed = str(business_data["index"]) in sf_ids
+    # Card HTML is cached on the displayed field values plus the push status
+    card_fields = tuple((col, business_data[col]) for col in MAP_COLUMNS if col in business_data)
+    return render_business_card_html(card_fields, already_pushed)
+
+def create_two_column_layout(ratio=(1, 1)):
     """Create a two-column layout with specified ratio"""
     return st.columns(ratio)
 
-def create_three_column_layout(ratio=[1, 1, 1]):
+def create_three_column_layout(ratio=(1, 1, 1)):
     """Create a three-column layout with specified ratio"""  
     return st.columns(ratio)
 
-def create_button_columns(left_content=None, right_content=None, ratio=[1, 1]):
+def create_button_columns(left_content=None, right_content=None, ratio=(1, 1)):
     """Create button layout columns with optional content"""
     col1, col2 = st.columns(ratio)
     if left_content:
@@ -3913,30 +3927,28 @@ def has_active_filters(filters):
         if k in STATIC_FILTERS
     )
 
+# Active-check per filter type; a filter type missing from this table is never active
+FILTER_ACTIVE_CHECKS = {
+    "dropdown": bool,
+    "range": lambda value: value != [None, None],
+    "checkbox": bool,
+    "text": lambda value: bool(value.strip() if isinstance(value, str) else value),
+    "location_radius": lambda value: isinstance(value, dict) and bool(value.get("address", "").strip()),
+    # For selectbox, check if it's not the default "Include" option
+    "selectbox": lambda value: bool(value) and not value.startswith("Include"),
+}
+
 def is_filter_active(filter_key, filter_value):
     """Check if a single filter is active/non-empty"""
-    if filter_key not in STATIC_FILTERS:
+    filter_config = STATIC_FILTERS.get(filter_key)
+    if filter_config is None:
         return False
-    
-    filter_type = STATIC_FILTERS[filter_key]["type"]
-    if filter_type == "dropdown":
-        return bool(filter_value)
-    elif filter_type == "range":
-        return filter_value != [None, None]
-    elif filter_type == "checkbox":
-        return bool(filter_value)
-    elif filter_type == "text":
-        return bool(filter_value.strip() if isinstance(filter_value, str) else filter_value)
-    elif filter_type == "location_radius":
-        return isinstance(filter_value, dict) and bool(filter_value.get("address", "").strip())
-    elif filter_type == "selectbox":
-        # For selectbox, check if it's not the default "Include" option
-        return filter_value and not filter_value.startswith("Include")
-    return False
+    check = FILTER_ACTIVE_CHECKS.get(filter_config["type"])
+    return check(filter_value) if check else False
 
 def get_filters_by_type(filter_type):
-    """Get all filter keys of a specific type"""
-    return [k for k in STATIC_FILTERS if STATIC_FILTERS[k]["type"] == filter_type]
+    """Get all filter keys of a specific type (shared list - do not mutate)"""
+    return FILTERS_BY_TYPE.get(filter_type, [])
 
 def get_map_styles():
     """Get the map styles configuration"""
@@ -3958,73 +3970,660 @@ def create_map_style_button(icon, key, help_text, current_style, column):
             type="primary" if current_style == icon else "secondary"
         ):
             st.session_state["map_style_selector"] = icon
-            st.rerun()
+            # Only called from the Map View fragment - restyling the map doesn't need a full app rerun
+            st.rerun(scope="fragment")
+
+# Radius scale session key -> reset value, keyed by whether businesses are selected on the map
+RADIUS_SCALE_KEYS = {
+    True: ("selected_radius_scale", "default_selected_radius_scale"),
+    False: ("initial_radius_scale", None),
+}
+
+def get_radius_scale_keys():
+    """Get the (scale key, default key) pair for the active map mode"""
+    return RADIUS_SCALE_KEYS[bool(st.session_state["selected_business_indices"])]
 
 def adjust_radius_scale(scale_factor, min_value=0.0001, max_value=10.0):
     """Adjust radius scale for selected or initial radius"""
-    if st.session_state["selected_business_indices"]:
-        current_scale = st.session_state["selected_radius_scale"]
-        new_scale = max(min_value, min(max_value, current_scale * scale_factor))
-        st.session_state["selected_radius_scale"] = new_scale
-    else:
-        current_scale = st.session_state["initial_radius_scale"]
-        new_scale = max(min_value, min(max_value, current_scale * scale_factor))
-        st.session_state["initial_radius_scale"] = new_scale
+    scale_key, _ = get_radius_scale_keys()
+    current_scale = st.session_state[scale_key]
+    st.session_state[scale_key] = max(min_value, min(max_value, current_scale * scale_factor))
 
 def reset_radius_scale():
     """Reset radius scale to default values"""
-    if st.session_state["selected_business_indices"]:
-        st.session_state["selected_radius_scale"] = st.session_state["default_selected_radius_scale"]
-    else:
-        st.session_state["initial_radius_scale"] = 1.0
+    scale_key, default_key = get_radius_scale_keys()
+    st.session_state[scale_key] = st.session_state[default_key] if default_key else 1.0
+
+@st.cache_resource(ttl=CACHE_TTL, max_entries=8, show_spinner=False)
+def build_map_deck(_map_data, data_key, selected_indices, map_style, view_state, initial_radius,
+                   initial_radius_scale, selected_radius_scale):
+    """Build the map view Deck (tooltips, layers, view state) - reused across reruns while the inputs are unchanged"""
+    # data_key is the map query's cache key plus the displayed row labels, so the frame itself is never hashed
+    selected_indices = list(selected_indices)
+    latitude, longitude, zoom = view_state
+    # Light and streets maps use Deep Blue for non-selected points, dark and satellite maps a much lighter blue
+    non_selected_color = NON_SELECTED_POINT_COLORS.get(map_style, NON_SELECTED_POINT_COLOR_DARK_MAP)
+
+    # Full tooltip HTML only for the selected businesses - every other point gets a compact summary
+    map_data = _map_data.assign(
+        tooltip=build_map_tooltips(_map_data, is_dark_map_style(map_style), selected_indices)
+    )
 
-def apply_gradient_class(element_class, gradient_type="primary"):
-    """Apply gradient class to elements via CSS injection"""
-    gradient_classes = {
-        "primary": "gp-gradient-primary",
-        "surface": "gp-gradient-surface", 
-        "light": "gp-gradient-light",
-        "dark": "gp-gradient-dark"
-    }
+    # Create map layers with multiple selection support
+    layers = []
+    
+    if selected_indices:
+        # Calculate dynamic radius based on zoom level and selection count
+        current_zoom = zoom
+        selection_count = len(selected_indices)
+        
+        # Dynamic radius calculation with better zoom scaling (reduced by ~50% for better visual clarity)
+        # Zoom tier: 0 (< 9), 1 (9-10), 2 (11-12), 3 (13-14), 4 (>= 15) - higher zoom = smaller points
+        zoom_tier = int(np.searchsorted(MAP_ZOOM_TIERS, current_zoom, side="right"))
+        zoom_scales = SINGLE_SELECTION_ZOOM_SCALES if selection_count == 1 else MULTI_SELECTION_ZOOM_SCALES
+        dynamic_radius_multiplier = selected_radius_scale * float(zoom_scales[zoom_tier])
+        
+        # Separate selected and non-selected businesses
+        non_selected_data = map_data[~map_data.index.isin(selected_indices)]
+        
+        # Create separate radius calculation for map view selected businesses (reduced by ~50% for better visual clarity)
+        map_view_radius_multiplier = selected_radius_scale * float(MAP_VIEW_RADIUS_ZOOM_SCALES[zoom_tier])
+        
+        # Add non-selected businesses layer (precompute fill_color)
+        if not non_selected_data.empty:
+            layers.append(
+                pdk.Layer(
+                    "ScatterplotLayer",
+                    data=build_layer_data(non_selected_data, non_selected_color),
+                    get_position=["lon", "lat"],
+                    get_fill_color="fill_color",
+                    get_radius=initial_radius * map_view_radius_multiplier * 0.9 * 0.9,
+                    pickable=True,
+                    auto_highlight=True
+                )
+            )
+        
+        # Build every selected row (with its fill_color) once instead of one copy per business
+        selected_rows = map_data.loc[selected_indices]
+        # Rows are in selection order, so the palette position is simply the row position
+        selected_palette_positions = np.arange(len(selected_rows)) % len(SELECTED_POINT_COLORS)
+        selected_layer_data = build_layer_data(
+            selected_rows, np.take(SELECTED_POINT_COLORS, selected_palette_positions, axis=0)
+        )
+        
+        # All selected businesses share one ColumnLayer (3D pillars), colored per row via fill_color
+        layers.append(
+            pdk.Layer(
+                "ColumnLayer",
+                data=selected_layer_data,
+                get_position=["lon", "lat"],
+                get_fill_color="fill_color",
+                get_elevation=20,
+                elevation_scale=initial_radius * map_view_radius_multiplier * 0.05,
+                radius=initial_radius * map_view_radius_multiplier * 0.9,
+                pickable=True,
+                auto_highlight=True
+            )
+        )
+    else:
+        # No selection - show all businesses, precompute fill_color
+        layers.append(
+            pdk.Layer(
+                "ScatterplotLayer",
+                data=build_layer_data(map_data, non_selected_color),
+                get_position=["lon", "lat"],
+                get_fill_color="fill_color",
+                get_radius=initial_radius * initial_radius_scale,
+                pickable=True,
+                auto_highlight=True
+            )
+        )
+    
+    # Create map view state
+    deck_view_state = pdk.ViewState(
+        latitude=latitude,
+        longitude=longitude,
+        zoom=zoom,
+        pitch=0
+    )
     
-    class_name = gradient_classes.get(gradient_type, "gp-gradient-primary")
+    # Create tooltip
+    tooltip = {
+        "html": "{tooltip}",
+        "style": {
+            "background-color": "transparent",
+            "color": "transparent",
+            "padding": "0",
+            "box-shadow": "none",
+            "border-radius": "0"
+        }
+    }
     
-    st.markdown(f"""
-        <style>
-        .{element_class} {{
-            background: var(--gp-gradient-{gradient_type}) !important;
-        }}
-        </style>
-    """, unsafe_allow_html=True)
+    return pdk.Deck(
+        layers=layers,
+        initial_view_state=deck_view_state,
+        map_style=get_map_styles().get(map_style),
+        tooltip=tooltip
+    )
+
+@st.fragment
+def render_map_tab():
+    """Render the Map View tab - a fragment, so map-only widgets rerun just this tab"""
+    map_styles = get_map_styles()
+    if hasattr(st.session_state, 'active_filters') and st.session_state.active_filters and has_active_filters(st.session_state.active_filters):
+        lon_col, lat_col = "LONGITUDE", "LATITUDE"
+        if lon_col in st.session_state.filtered_df.columns and lat_col in st.session_state.filtered_df.columns:
+            map_df, total_records = with_loading_spinner(
+                "Fetching all data for map...", lambda: fetch_map_data(st.session_state.active_filters)
+            )
+            # The map query already selects MAP_COLUMNS - only keep those that came back
+            existing_cols = [col for col in MAP_COLUMNS if col in map_df.columns]
+            map_data = map_df[existing_cols].dropna(subset=[lat_col, lon_col])
+            map_data = map_data.rename(columns={lat_col: "lat", lon_col: "lon"})
+            lat_values = map_data["lat"].to_numpy()
+            lon_values = map_data["lon"].to_numpy()
+            valid_coords = (lat_values >= -90) & (lat_values <= 90) & (lon_values >= -180) & (lon_values <= 180)
+            map_data = map_data[valid_coords]
+
+            # Filter map data based on selected businesses from list view
+            if hasattr(st.session_state, 'selected_map_uids'):
+                # User has interacted with the list view checkboxes
+                if len(st.session_state.selected_map_uids) > 0:
+                    # Some businesses are selected - show only those
+                    map_data = map_data[map_data['DATA_AGG_UID'].isin(st.session_state.selected_map_uids)]
+                else:
+                    # No businesses selected (user unchecked all) - show empty map
+                    map_data = map_data.iloc[0:0]  # Empty dataframe with same structure
+            else:
+                # User hasn't interacted with list view yet - show all businesses by default
+                pass
+            
+            if len(map_data) > MAP_POINTS_LIMIT:
+                # Fixed seed keeps the same sample across reruns; sorted positions preserve row order
+                sample_positions = np.random.default_rng(42).choice(len(map_data), MAP_POINTS_LIMIT, replace=False)
+                map_data = map_data.iloc[np.sort(sample_positions)]
+                st.warning(f"Map limited to {MAP_POINTS_LIMIT} points for performance. Total records: {total_records}.")
+            if not map_data.empty:
+                map_data = normalize_map_flag_columns(map_data)
+                map_data["index"] = map_data.index
+                # Viewport only changes when the displayed points do - cached on the coordinates
+                center_lat, center_lon, default_zoom, initial_radius = compute_map_viewport(
+                    tuple(map_data["lat"]), tuple(map_data["lon"])
+                )
+                
+                # Initialize map-related session state
+                init_session_state_key("initial_radius_scale", 1.0)
+                init_session_state_key("selected_radius_scale", 1.0)
+                init_session_state_key("default_selected_radius_scale", 1.0)
+                init_session_state_key("map_view_state", {
+                        "latitude": center_lat,
+                        "longitude": center_lon,
+                        "zoom": default_zoom
+                    })
+                init_session_state_key("selected_business_indices", [])
+                
+                # Migrate from old single selection to new multiple selection (if it exists)
+                if hasattr(st.session_state, 'selected_business_index') and st.session_state.selected_business_index is not None:
+                    st.session_state.selected_business_indices = [st.session_state.selected_business_index]
+                    delattr(st.session_state, 'selected_business_index')
+                
+                # Clean up any indices that are no longer in the data
+                st.session_state.selected_business_indices = [
+                    idx for idx in st.session_state.selected_business_indices 
+                    if idx in map_data.index
+                ]
+                # Sort businesses alphabetically by name for better user experience
+                sorted_map_data = map_data.sort_values("DBA_NAME")
+                
+                # Create business options (DATA_AGG_UIDs) and the UID/index/label lookups - cached per data set
+                business_options, business_uid_to_index, business_uid_to_label, index_to_business_uid = build_business_lookups(
+                    tuple(sorted_map_data["DATA_AGG_UID"]),
+                    tuple(sorted_map_data["DBA_NAME"]),
+                    tuple(sorted_map_data["index"])
+                )
+
+                # Get current selection for multiselect (as DATA_AGG_UIDs)
+                current_selection = [
+                    index_to_business_uid[idx] for idx in st.session_state.selected_business_indices
+                    if idx in index_to_business_uid
+                ]
+
+                # Use multiselect with DATA_AGG_UID as value, DBA_NAME (and address) as display
+                selected_businesses = st.multiselect(
+                    "🔍 Search and select up to 5 businesses to view details",
+                    options=business_options,
+                    default=current_selection,
+                    key="business_multiselect",
+                    help="Type to search and select up to 5 businesses - alphabetically sorted",
+                    max_selections=5,
+                    placeholder="Type to search business names...",
+                    format_func=lambda uid: business_uid_to_label.get(uid, str(uid))
+                )
+
+                # Handle selection logic - allow multiple selections
+                selected_indices = []
+                if selected_businesses:
+                    selected_indices = [business_uid_to_index[uid] for uid in selected_businesses]
+                
+                # Show total count
+                if hasattr(st.session_state, 'selected_map_uids'):
+                    if len(st.session_state.selected_map_uids) > 0:
+                        st.caption(f"Showing {len(map_data)} selected businesses on map • {len(selected_businesses)}/5 selected")
+                    else:
+                        st.caption(f"No businesses selected for mapping - map is empty • {len(selected_businesses)}/5 selected")
+                else:
+                    st.caption(f"Showing all {len(map_data)} businesses on map (default) • {len(selected_businesses)}/5 selected")
+                
+                # Update session state with new selections
+                if set(selected_indices) != set(st.session_state.selected_business_indices):
+                    st.session_state.selected_business_indices = selected_indices
+                    
+                    # Calculate new map view state to encompass all selected businesses
+                    if selected_indices:
+                        selected_data = map_data.loc[selected_indices]
+                        if len(selected_indices) == 1:
+                            # Single selection - zoom in close
+                            single_business = selected_data.iloc[0]
+                            st.session_state.map_view_state = {
+                                "latitude": float(single_business["lat"]),
+                                "longitude": float(single_business["lon"]),
+                                "zoom": SELECTED_BUSINESS_ZOOM
+                            }
+                        else:
+                            # Multiple selections - fit all businesses in view with padding
+                            selected_coords = selected_data[["lat", "lon"]].to_numpy(dtype=float)
+                            selected_lat_min, selected_lon_min = selected_coords.min(axis=0).tolist()
+                            selected_lat_max, selected_lon_max = selected_coords.max(axis=0).tolist()
+                            selected_center_lat = (selected_lat_min + selected_lat_max) / 2
+                            selected_center_lon = (selected_lon_min + selected_lon_max) / 2
+                            
+                            # Calculate base differences
+                            selected_lat_diff = selected_lat_max - selected_lat_min
+                            selected_lon_diff = selected_lon_max - selected_lon_min
+                            
+                            # Add padding buffer for better visibility (SAME AS INITIAL MAP VIEW)
+                            padding_factor = 0.3  # 30% padding around the points (matching initial view)
+                            selected_lat_diff = max(selected_lat_diff, 0.01) + (selected_lat_diff * padding_factor)
+                            selected_lon_diff = max(selected_lon_diff, 0.01) + (selected_lon_diff * padding_factor)
+                            
+                            if selected_lat_diff == 0 or selected_lon_diff == 0:
+                                selected_zoom = DEFAULT_MAP_ZOOM  # Same as initial view for zero diff
+                            else:
+                                # Calculate zoom level to fit the padded area (SAME AS INITIAL MAP VIEW)
+                                lat_zoom = LAT_ZOOM_BASE - math.log2(selected_lat_diff)
+                                lon_zoom = LON_ZOOM_BASE - math.log2(selected_lon_diff * math.cos(math.radians(selected_center_lat)))
+                                
+                                # Reduced zoom calculation for better visibility (SAME AS INITIAL MAP VIEW)
+                                selected_zoom = min(lat_zoom, lon_zoom) - 2  # Same -2 reduction as initial view
+                                
+                                # Special handling for 2-3 business selections (more aggressive zoom-in)
+                                num_selected = len(st.session_state.selected_business_indices)
+                                if num_selected == 2 or num_selected == 3:
+                                    # For 2-3 businesses, use a much higher minimum zoom for closer view
+                                    selected_zoom = max(selected_zoom, 11)  # Increased from 8 to 11 for much closer view
+                                    selected_zoom = min(selected_zoom, 14)  # Allow up to 14 for very close viewing
+                                elif num_selected <= 3:
+                                    # For other small numbers, use the original logic
+                                    selected_zoom = max(selected_zoom, 8)
+                                    selected_zoom = min(selected_zoom, 12)
+                                
+                                # Ensure reasonable zoom bounds (SAME AS INITIAL MAP VIEW)
+                                selected_zoom = max(4, min(15, round(selected_zoom)))  # Raised minimum from 2 to 4
+                            
+                            st.session_state.map_view_state = {
+                                "latitude": selected_center_lat,
+                                "longitude": selected_center_lon,
+                                "zoom": selected_zoom
+                            }
+                        
+                        base_selected_scale = 30 / initial_radius if initial_radius != 0 else 1.0
+                        st.session_state.selected_radius_scale = base_selected_scale
+                        st.session_state.default_selected_radius_scale = base_selected_scale
+                    else:
+                        # No selection - reset to default view
+                        st.session_state.map_view_state = {
+                            "latitude": center_lat,
+                            "longitude": center_lon,
+                            "zoom": default_zoom
+                        }
+                        st.session_state.initial_radius_scale = 1.0
+                        st.session_state.selected_radius_scale = 1.0
+                        st.session_state.default_selected_radius_scale = 1.0
+                    st.rerun()
+                
+                # Display selected business details
+                if st.session_state.selected_business_indices:
+                    # Direct label lookup - selected indices were pruned to map_data.index above
+                    selected_business_data = map_data.loc[list(st.session_state.selected_business_indices)]
+                    # Salesforce IDs read once per rerun for the push-status checks below
+                    sf_ids = get_sf_business_id_set()
+                    # Plain dict records (in selection order) - the "index" field carries the row label
+                    business_records = selected_business_data.to_dict("records")
+                    
+                    if len(st.session_state.selected_business_indices) == 1:
+                        # Single business - show full details
+                        business_data = business_records[0]
+                        st.markdown(format_business_data_html(business_data, sf_ids), unsafe_allow_html=True)
+                        
+                        # Add native Streamlit button for Salesforce action
+                        business_idx = business_data["index"]
+                        sf_key = f"sf_push_{business_idx}"
+                        business_name = business_data.get("DBA_NAME", "")
+                        
+                        # Check if this business was already pushed to Salesforce
+                        business_idx_str = str(business_idx)
+                        already_pushed = business_idx_str in sf_ids
+                        
+                        if not already_pushed:
+                            # Create columns for left-justified button
+                            sf_cols = create_button_layout()
+                            with sf_cols[0]:  # Button in left column
+                                # Updated button label with business name
+                                button_label = f"Send {business_name} to Salesforce"
+                                
+                                push_button = st.button(button_label, type="primary", key=sf_key)
+                                
+                                if push_button:
+                                    # Add this business to Salesforce
+                                    add_business_to_salesforce(business_idx)
+                                    
+                                    # Show success message with compact styling
+                                    success_msg = f'<p style="color:#0c8a15; font-size:11px; margin:0; padding:0; font-weight:500;">✓ Added to Salesforce</p>'
+                                    st.markdown(success_msg, unsafe_allow_html=True)
+                                    
+                                    # Log for debugging
+                                    print(f"Pushed business ID {business_idx} to Salesforce")
+                                    print(f"Total businesses in Salesforce: {st.session_state.sf_pushed_count}")
+                                    
+                                    # Rerun to update UI
+                                    st.rerun()
+                    else:
+                        # Multiple businesses - show in tabs and add bulk actions
+                        
+                        # Check if all selected businesses are already pushed
+                        all_pushed = {str(idx) for idx in st.session_state.selected_business_indices}.issubset(sf_ids)
+                        
+                        # Add compact bulk push button - left justified
+                        # Create columns for left-justified button layout
+                        btn_col1, btn_col2 = create_button_layout()
+                        
+                        with btn_col1:
+                            if all_pushed:
+                                # Use markdown with custom styling - left-justified
+                                st.markdown('<p style="color:#0c8a15; font-size:11px; margin:0; padding:0; font-weight:500;">✓ All pushed</p>', unsafe_allow_html=True)
+                            else:
+                                # Updated button label
+                                button_label = "Send Selected to Salesforce"
+                                
+                                # Add CSS to prevent button text wrapping
+                                st.markdown(NOWRAP_PRIMARY_BUTTON_CSS, unsafe_allow_html=True)
+                                
+                                bulk_push = st.button(button_label, 
+                                            type="primary", key="sf_bulk_push_button")
+                                if bulk_push:
+                                    # Get the subset of businesses that are selected
+                                    selected_businesses = selected_business_data
+                                    
+                                    # Add each business to Salesforce
+                                    count = add_businesses_to_salesforce(selected_businesses)
+                                    
+                                    # Rerun to update UI
+                                    st.rerun()
+                        
+                        # Multiple businesses - show in tabs, labels built column-wise (pushed indicator, then truncation)
+                        business_names = selected_business_data["DBA_NAME"].fillna("").astype(str)
+                        pushed_mask = selected_business_data.index.map(str).isin(sf_ids)
+                        business_names = business_names.where(~pushed_mask, business_names + " ✓")
+                        tab_labels = np.where(
+                            business_names.str.len() > 25,
+                            "📍 " + business_names.str.slice(0, 25) + "...",
+                            "📍 " + business_names,
+                        ).tolist()
+                        selected_tabs = st.tabs(tab_labels)
+                        
+                        for i, (tab, business_data) in enumerate(zip(selected_tabs, business_records)):
+                            with tab:
+                                st.markdown(format_business_data_html(business_data, sf_ids), unsafe_allow_html=True)
+                                
+                                # Add native Streamlit button for Salesforce action
+                                business_idx = business_data["index"]
+                                sf_key = f"sf_push_tab_{i}_{business_idx}"
+                                business_name = business_data.get("DBA_NAME", "")
+                                
+                                # Check if this business was already pushed to Salesforce
+                                business_idx_str = str(business_idx)
+                                already_pushed = business_idx_str in sf_ids
+                                
+                                # Create a smaller, more compact layout with columns
+                                if already_pushed:
+                                    # No button needed, so no columns needed
+                                    pass
+                                else:
+                                    # Determine column ratio based on business name length - more space for longer names
+                                    # This helps ensure the button text stays on one line
+                                    left_col_size = 1
+                                    right_col_size = 1
+                                    
+                                    if len(business_name) <= 10:
+                                        # Very short names
+                                        left_col_size, right_col_size = 2, 1  # 2:1 ratio
+                                    elif len(business_name) <= 20:
+                                        # Medium length names
+                                        left_col_size, right_col_size = 1, 1  # 1:1 ratio
+                                    else:
+                                        # Long names
+                                        left_col_size, right_col_size = 1, 2  # 1:2 ratio
+                                    
+                                    # Create a dynamic layout with columns for left-justified button
+                                    sf_cols = create_button_layout()
+                                    with sf_cols[0]:  # Button in left column
+                                        # Updated button label with business name
+                                        button_label = f"Send {business_name} to Salesforce"
+                                        
+                                        push_button = st.button(button_label, type="primary", key=sf_key)
+                                        
+                                        if push_button:
+                                            # Add to Salesforce
+                                            add_business_to_salesforce(business_idx)
+                                            
+                                            # Rerun to update UI
+                                            st.rerun()
+                                            st.write("Updating Salesforce tab data...")
+                                            
+                                            # Show current state
+                                            st.write(f"Total businesses in Salesforce: {st.session_state.sf_pushed_count}")
+                                            st.write(f"Business IDs in Salesforce: {st.session_state.sf_business_ids}")
+                                            
+                                            # Continue only if the user clicks to confirm
+                                            if st.button("Continue", key=f"tab_continue_{i}"):
+                                                st.rerun()
+                    
+
+                
+                # Layers and deck are rebuilt only when the points, selection, style, view or radius change
+                deck = build_map_deck(
+                    map_data,
+                    (create_cache_key("map_data", st.session_state.active_filters), tuple(map_data.index)),
+                    tuple(st.session_state.selected_business_indices),
+                    get_current_map_style(),
+                    (
+                        float(st.session_state.map_view_state["latitude"]),
+                        float(st.session_state.map_view_state["longitude"]),
+                        int(st.session_state.map_view_state["zoom"]),
+                    ),
+                    initial_radius,
+                    st.session_state.initial_radius_scale,
+                    st.session_state.selected_radius_scale,
+                )
+                
+                # No longer need JavaScript for Salesforce buttons - using native Streamlit buttons
+                
+                #st.markdown(f"**Total Businesses Displayed:** {len(map_data)}")
+                st.pydeck_chart(deck)
+                
+                # Map controls styling
+                st.markdown(
+                    """
+                    <style>
+                    div[data-testid="stHorizontalBlock"] > div:first-child {
+                        display: flex;
+                        justify-content: flex-start;
+                        align-items: center;
+                        padding-left: 0;
+                        margin-left: 0;
+                    }
+                    div[data-testid="stHorizontalBlock"] > div:first-child > div[data-testid="stHorizontalBlock"] {
+                        display: flex;
+                        justify-content: flex-start;
+                        gap: 4px;
+                        margin: 0;
+                        padding: 0;
+                    }
+                    div[data-testid="stHorizontalBlock"] > div:first-child button[kind="secondary"] {
+                        padding: 6px;
+                        font-size: 12px;
+                        width: 36px;
+                        height: 36px;
+                        min-width: unset;
+                        border: 1px solid #e6e6e6;
+                        background-color: #f0f2f6;
+                        color: #333333;
+                        border-radius: 4px;
+                    }
+                    div[data-testid="stHorizontalBlock"] > div:last-child {
+                        display: flex;
+                        justify-content: flex-end;
+                        align-items: center;
+                        padding-right: 0;
+                        margin-right: 0;
+                    }
+                    </style>
+                    """,
+                    unsafe_allow_html=True
+                )
+                
+                # Map controls
+                col_left, col_spacer, col_right = create_map_controls_layout()
+                with col_left:
+                    col_larger, col_reset, col_smaller = create_radius_controls_layout()
+                    with col_smaller:
+                        if st.button(":material/remove:", key="radius_smaller", use_container_width=True, help="Shrink map points"):
+                            adjust_radius_scale(0.5)
+                            st.rerun(scope="fragment")
+                    with col_larger:
+                        if st.button(":material/add:", key="radius_larger", use_container_width=True, help="Enlarge map points"):
+                            adjust_radius_scale(2.0)
+                            st.rerun(scope="fragment")
+                    with col_reset:
+                        if st.button(":material/refresh:", key="radius_refresh", use_container_width=True, help="Reset map points radius"):
+                            reset_radius_scale()
+                            st.rerun(scope="fragment")
+                with col_right:
+                    # Map style buttons arranged in single row
+                    style_col1, style_col2, style_col3, style_col4 = create_map_style_buttons_layout()
+                    
+                    current_style = get_current_map_style()
+                    
+                    create_map_style_button(
+                        ":material/light_mode:",
+                        "map_style_light", 
+                        "Light map style",
+                        current_style,
+                        style_col1
+                    )
+                    
+                    create_map_style_button(
+                        ":material/dark_mode:",
+                        "map_style_dark",
+                        "Dark map style", 
+                        current_style,
+                        style_col2
+                    )
+                    
+                    create_map_style_button(
+                        ":material/satellite_alt:",
+                        "map_style_satellite",
+                        "Satellite map style",
+                        current_style,
+                        style_col3
+                    )
+                    
+                    create_map_style_button(
+                        ":material/terrain:",
+                        "map_style_terrain",
+                        "Street map style",
+                        current_style,
+                        style_col4
+                    )
+            else:
+                init_session_state_key("map_view_state", {
+                    "latitude": 39.8283,
+                    "longitude": -98.5795,
+                    "zoom": 4
+                })
+                st.warning("No valid longitude/latitude data available after filtering.")
+                view_state = pdk.ViewState(
+                    latitude=float(st.session_state.map_view_state["latitude"]),
+                    longitude=float(st.session_state.map_view_state["longitude"]),
+                    zoom=int(st.session_state.map_view_state["zoom"]),
+                    pitch=0
+                )
+                deck = pdk.Deck(
+                    layers=[],
+                    initial_view_state=view_state,
+                    map_style=map_styles.get(get_current_map_style())
+                )
+                st.pydeck_chart(deck)
+        else:
+            st.error(f"Map requires '{lon_col}' and '{lat_col}' columns in the table.")
+            init_session_state_key("map_view_state", {
+                "latitude": 39.8283,
+                "longitude": -98.5795,
+                "zoom": 4
+            })
+            view_state = pdk.ViewState(
+                latitude=float(st.session_state.map_view_state["latitude"]),
+                longitude=float(st.session_state.map_view_state["longitude"]),
+                zoom=int(st.session_state.map_view_state["zoom"]),
+                pitch=0
+            )
+            deck = pdk.Deck(
+                layers=[],
+                initial_view_state=view_state,
+                map_style=map_styles.get(get_current_map_style())
+            )
+            st.pydeck_chart(deck)
+    # else:
+        # Removed redundant message - already shown in active filters section
 
 def main():
-    if "cortex_warnings" not in st.session_state:
-        st.session_state.cortex_warnings = []
-    if "cortex_messages" not in st.session_state:
-        st.session_state.cortex_messages = []
+    # Snapshot existing keys once instead of probing session state for each init check
+    ss = st.session_state
+    present = set(ss.keys())
+    if "cortex_warnings" not in present:
+        ss.cortex_warnings = []
+    if "cortex_messages" not in present:
+        ss.cortex_messages = []
 
     # Initialize filter triggers to force refresh of dropdowns when contact info filter is set to default
-    if "app_initialized" not in st.session_state:
-        st.session_state["app_initialized"] = True
+    if "app_initialized" not in present:
+        ss["app_initialized"] = True
         # Force all dropdown filters to refresh since we start with contact info filter active
-        dropdown_filters = [k for k, v in STATIC_FILTERS.items() if v["type"] == "dropdown"]
+        dropdown_filters = get_filters_by_type("dropdown")
         
         # Initialize filter_update_trigger if it doesn't exist
-        if "filter_update_trigger" not in st.session_state:
-            st.session_state["filter_update_trigger"] = {col: 0 for col in dropdown_filters}
+        if "filter_update_trigger" not in present:
+            ss["filter_update_trigger"] = {col: 0 for col in dropdown_filters}
         
         # Increment all dropdown filter triggers to force refresh with contact info dependency
         for col in dropdown_filters:
-            st.session_state["filter_update_trigger"][col] += 1
+            ss["filter_update_trigger"][col] += 1
         
         # Also ensure we mark this as needing a filter refresh for the UI
-        st.session_state["force_filter_refresh"] = True
+        ss["force_filter_refresh"] = True
 
     filters, apply_filters = create_sidebar_filters()
 
-    CORTEX_MODEL_PATH = "SANDBOX.CONKLIN.CORTEX_ANALYST_PROSPECTOR/lead_portal.yaml"
-    API_ENDPOINT = "/api/v2/cortex/analyst/message"
-    API_TIMEOUT = 50000
     session = get_active_session()
 
     sidebar_prompt = st.session_state.get("sidebar_cortex_prompt", "")
@@ -4037,11 +4636,13 @@ def main():
                 sidebar_prompt,
                 session,
                 _snowflake,
-                CORTEX_MODEL_PATH,
-                API_ENDPOINT,
-                API_TIMEOUT,
                 rerun_on_success=True
             )
+    # Queued Cortex Analyst errors render as one block, then the queue is emptied
+    cortex_errors = st.session_state.get("cortex_errors")
+    if cortex_errors:
+        st.error("\n\n".join(cortex_errors))
+        cortex_errors.clear()
 
     display_filter_summary(st.session_state["active_filters"])
     
@@ -4051,34 +4652,46 @@ def main():
     # Ensure sf_pushed_count is initialized
     init_session_state_key("sf_pushed_count", 0)
     
-    # Ensure sf_last_update is initialized
-    init_session_state_key("sf_last_update", datetime.now().isoformat())
+    # Ensure sf_last_update is initialized (timestamp only built when missing)
+    if "sf_last_update" not in ss:
+        ss["sf_last_update"] = datetime.now().isoformat()
     
     tab1, tab2, tab3 = st.tabs(["List View", "Map View", "Salesforce"])
 
     cortex_df = None
     cortex_total_records = 0
     sidebar_prompt = st.session_state.get("sidebar_cortex_prompt", "")
-    if sidebar_prompt and "cortex_messages" in st.session_state:
-        for msg in reversed(st.session_state["cortex_messages"]):
-            if msg.get("role") == "analyst":
-                for item in msg.get("content", []):
-                    if item.get("type") == "sql" and "statement" in item:
-                        original_sql = item["statement"]
-                        import re
-                        simple_select_pattern = r"^\s*SELECT\s+([\w,\s]+)\s+FROM\s+([\w\.]+)"  # e.g. SELECT col1, col2 FROM table
-                        if re.match(simple_select_pattern, original_sql, flags=re.IGNORECASE):
-                            rewritten_sql = re.sub(r"SELECT\s+.+?\s+FROM", "SELECT * FROM", original_sql, flags=re.IGNORECASE|re.DOTALL)
-                        else:
-                            rewritten_sql = original_sql
-                        try:
-                            cortex_df = session.sql(rewritten_sql).to_pandas()
-                            cortex_total_records = len(cortex_df)
-                        except Exception as e:
-                            st.error(f"Error executing Cortex SQL for List/Map View: {e}")
-                        break
-                if cortex_df is not None:
-                    break
+    cortex_messages = st.session_state.get("cortex_messages", [])
+    if sidebar_prompt and cortex_messages:
+        # Only re-run the analyst SQL when a new analyst response has arrived
+        if st.session_state.get("cortex_messages_dirty", False) or "cortex_df_cache" not in st.session_state:
+            # First SQL item of the most recent analyst message - the generator stops at the first match
+            sql_item = next(
+                (
+                    item
+                    for msg in reversed(cortex_messages) if msg.get("role") == "analyst"
+                    for item in msg.get("content", []) if item.get("type") == "sql" and "statement" in item
+                ),
+                None,
+            )
+            if sql_item is not None:
+                original_sql = sql_item["statement"]
+                simple_select_pattern = r"^\s*SELECT\s+([\w,\s]+)\s+FROM\s+([\w\.]+)"  # e.g. SELECT col1, col2 FROM table
+                if re.match(simple_select_pattern, original_sql, flags=re.IGNORECASE):
+                    rewritten_sql = re.sub(r"SELECT\s+.+?\s+FROM", "SELECT * FROM", original_sql, flags=re.IGNORECASE|re.DOTALL)
+                else:
+                    rewritten_sql = original_sql
+                try:
+                    # Smaller integer dtypes for a frame that lives in session state all session
+                    cortex_df = downcast_integer_columns(session.sql(rewritten_sql).to_pandas())
+                except Exception as e:
+                    st.error(f"Error executing Cortex SQL for List/Map View: {e}")
+            st.session_state["cortex_df_cache"] = cortex_df
+            st.session_state["cortex_messages_dirty"] = False
+        else:
+            cortex_df = st.session_state["cortex_df_cache"]
+        if cortex_df is not None:
+            cortex_total_records = len(cortex_df)
     if cortex_df is not None:
         st.session_state["filtered_df"] = cortex_df
         st.session_state["total_records"] = cortex_total_records
@@ -4086,9 +4699,9 @@ def main():
         def fetch_data():
             cache_key = create_cache_key("filtered_data", filters)
             reset_to_first_page()
-            return fetch_filtered_data(
-                filters, cache_key, st.session_state["page_size"], st.session_state["current_page"], fetch_all=True
-            )
+            # Every filtered row (capped at MAX_RESULTS) stays in filtered_df - the Salesforce tab looks up
+            # selections made on any page or on the map
+            return fetch_filtered_data(filters, cache_key)
         st.session_state["filtered_df"], st.session_state["total_records"] = with_loading_spinner(
             "Fetching data...", fetch_data
         )
@@ -4120,48 +4733,12 @@ def main():
                 st.warning("No results found matching your current filters. Try adjusting your search criteria.")
             return  # Exit early if no data to display
         
+        # Results views are rendering this run - add their stylesheet on top of the base theme
+        inject_results_css()
+        
         # Unified List View: always use filtered_df and total_records
         # --- Normalize columns and format for analyst and filter results ---
         if show_df is not None and not show_df.empty:
-            # Drop unnecessary columns but keep address fields for now
-            display_df = show_df.copy()
-            # Add missing columns if not present
-            for col in [
-                "Map", "SF", "Current Customer", "DBA_NAME", "ADDRESS_LINK", "FULL_ADDRESS",
-                "PHONE", "WEBSITE", "CONTACT_NAME", "CONTACT_EMAIL", "CONTACT_PHONE",
-                "PRIMARY_INDUSTRY", "SUB_INDUSTRY", "SIC_CODE", "REVENUE",
-                "NUMBER_OF_EMPLOYEES", "NUMBER_OF_LOCATIONS", "IS_B2B", "IS_B2C", "PARENT_NAME", "PARENT_PHONE", "PARENT_WEBSITE"
-            ]:
-                if col not in display_df.columns:
-                    display_df[col] = ""  # Add empty column
-            display_df['Map'] = True
-            display_df['SF'] = False
-            # Create a combined address column for Google Maps links
-            address_cols = ['ADDRESS', 'CITY', 'STATE', 'ZIP']
-            if all(col in display_df.columns for col in address_cols):
-                display_df['ADDRESS_LINK'] = display_df.apply(create_address_link, axis=1)
-                display_df['FULL_ADDRESS'] = display_df.apply(create_full_address, axis=1)
-            # Format phone numbers for clickable tel: links
-            if 'PHONE' in display_df.columns:
-                display_df['PHONE'] = display_df['PHONE'].apply(format_phone_for_link)
-            if 'CONTACT_PHONE' in display_df.columns:
-                display_df['CONTACT_PHONE'] = display_df['CONTACT_PHONE'].apply(format_phone_for_link)
-            if 'CONTACT_MOBILE' in display_df.columns:
-                display_df['CONTACT_MOBILE'] = display_df['CONTACT_MOBILE'].apply(format_phone_for_link)
-            # Format email addresses for clickable mailto: links
-            if 'CONTACT_EMAIL' in display_df.columns:
-                display_df['CONTACT_EMAIL'] = display_df['CONTACT_EMAIL'].apply(format_email_for_link)
-            if 'PARENT_PHONE' in display_df.columns:
-                display_df['PARENT_PHONE'] = display_df['PARENT_PHONE'].apply(format_phone_for_link)
-            # Reorder columns to match sidebar filter output
-            column_order = [
-                "Map", "SF", "Current Customer", "DBA_NAME", "ADDRESS_LINK", "FULL_ADDRESS",
-                "PHONE", "WEBSITE", "CONTACT_NAME", "CONTACT_EMAIL", "CONTACT_PHONE", "CONTACT_MOBILE", "CONTACT_JOB_TITLE",
-                "PRIMARY_INDUSTRY", "SUB_INDUSTRY", "SIC_CODE", "REVENUE",
-                "NUMBER_OF_EMPLOYEES", "NUMBER_OF_LOCATIONS", "PARENT_NAME", "PARENT_PHONE", "PARENT_WEBSITE", "IS_B2B", "IS_B2C"
-            ]
-            display_df = display_df[column_order]
-
             if "limit_warning" in st.session_state:
                 st.warning(st.session_state.limit_warning)
             total_records = show_total
@@ -4175,7 +4752,6 @@ def main():
             start_idx = pagination_values['start_idx']
             end_idx = pagination_values['end_idx']
             rows_to_display = min(st.session_state.page_size, total_records - start_idx)
-            display_df = display_df.iloc[start_idx:end_idx]
             if rows_to_display < st.session_state.page_size:
 
                 height_for_rows = rows_to_display
@@ -4194,300 +4770,11 @@ def main():
             min_height = (MIN_DISPLAY_ROWS * ROW_HEIGHT) + header_buffer  # Minimum for 2 rows
             max_height = MAX_DATAFRAME_HEIGHT  # Reduced maximum height
             dataframe_height = max(min_height, min(total_height, max_height))
-            display_df = show_df.iloc[start_idx:end_idx]
-            
-            # Update column order to use FULL_ADDRESS and exclude individual address fields
-            column_order = [
-                "Map", "SF", "Current Customer", "DBA_NAME", "ADDRESS_LINK", "FULL_ADDRESS",
-                "PHONE", "WEBSITE", "CONTACT_NAME", "CONTACT_EMAIL", "CONTACT_PHONE", "CONTACT_MOBILE", "CONTACT_JOB_TITLE",
-                "PRIMARY_INDUSTRY", "SUB_INDUSTRY", "SIC_CODE", "REVENUE",
-                "NUMBER_OF_EMPLOYEES", "NUMBER_OF_LOCATIONS", "PARENT_NAME", "PARENT_PHONE", "PARENT_WEBSITE", "IS_B2B", "IS_B2C"
-            ]
-            
-            # Initialize Map and SF columns with their default states
             page_key = f"page_{st.session_state.current_page}_size_{st.session_state.page_size}"
-            display_df['Map'] = True  # Default value for Map column
-            display_df['SF'] = False  # Default value for SF column
-            
-            # Create Current Customer column based on IS_CURRENT_CUSTOMER field
-            if 'IS_CURRENT_CUSTOMER' in display_df.columns:
-                display_df['Current Customer'] = display_df['IS_CURRENT_CUSTOMER'].apply(
-                    lambda x: "🔵" if x is True or x == True else "⚪"
-                )
-            else:
-                display_df['Current Customer'] = "⚪"
-            display_df = display_df.drop(columns=['LONGITUDE', 'LATITUDE', 'IS_CURRENT_CUSTOMER'], errors='ignore')            
-            # Format URLs to ensure they are absolute URLs
-            if 'WEBSITE' in display_df.columns:
-                display_df['WEBSITE'] = display_df['WEBSITE'].apply(format_url)
-            if 'PARENT_WEBSITE' in display_df.columns:
-                display_df['PARENT_WEBSITE'] = display_df['PARENT_WEBSITE'].apply(format_url)
-            
-            # Create a combined address column for Google Maps links
-            address_cols = ['ADDRESS', 'CITY', 'STATE', 'ZIP']
-            if all(col in display_df.columns for col in address_cols):
-                # Create combined address parts list and add Address Link column
-                display_df['ADDRESS_LINK'] = display_df.apply(create_address_link, axis=1)
-                
-                # Add the FULL_ADDRESS column
-                display_df['FULL_ADDRESS'] = display_df.apply(create_full_address, axis=1)
-                
-                # Reorder columns to put ADDRESS_LINK right after DBA_NAME and before FULL_ADDRESS
-                if 'DBA_NAME' in display_df.columns:
-                    # Get all columns
-                    cols = display_df.columns.tolist()
-                    
-                    # Start with specified columns in order
-                    ordered_cols = []
-                    for col in ["Map", "SF", "Current Customer", "DBA_NAME", "ADDRESS_LINK", "FULL_ADDRESS", "PHONE"]:
-                        if col in cols:
-                            ordered_cols.append(col)
-                            cols.remove(col)
-                    
-                    # Add WEBSITE directly (not after identifier)
-                    if "WEBSITE" in cols:
-                        ordered_cols.append("WEBSITE")
-                        cols.remove("WEBSITE")
-                    
-                    # Remove identifier from the columns list to add it at the end
-                    if "IDENTIFIER" in cols:
-                        cols.remove("IDENTIFIER")
-                    
-                    # Remove individual address columns
-                    for addr_col in ['ADDRESS', 'CITY', 'STATE', 'ZIP']:
-                        if addr_col in cols:
-                            cols.remove(addr_col)
-                    
-                    # Add remaining columns
-                    ordered_cols.extend(cols)
-                    
-                    # Add identifier at the very end
-                    if "IDENTIFIER" in display_df.columns:
-                        ordered_cols.append("IDENTIFIER")
-                    
-                    # Apply the new order
-                    display_df = display_df[ordered_cols]
-            
-            # Format phone numbers for clickable tel: links  
-            if 'PHONE' in display_df.columns:
-                display_df['PHONE'] = display_df['PHONE'].apply(format_phone_for_link)
-            if 'CONTACT_PHONE' in display_df.columns:
-                display_df['CONTACT_PHONE'] = display_df['CONTACT_PHONE'].apply(format_phone_for_link)
-            if 'CONTACT_MOBILE' in display_df.columns:
-                display_df['CONTACT_MOBILE'] = display_df['CONTACT_MOBILE'].apply(format_phone_for_link)
-            # Format email addresses for clickable mailto: links
-            if 'CONTACT_EMAIL' in display_df.columns:
-                display_df['CONTACT_EMAIL'] = display_df['CONTACT_EMAIL'].apply(format_email_for_link)
-            if 'PARENT_PHONE' in display_df.columns:
-                display_df['PARENT_PHONE'] = display_df['PARENT_PHONE'].apply(format_phone_for_link)
-            
-            styled_df = display_df.style.format(get_dataframe_format_config())
-            def apply_gp_branding(row):
-                """Apply Global Payments bento-style soft UI design with rounded corners and brand colors"""
-                styles = []
-                
-                # Base styling with soft shapes and rounded corners
-                base_style = (
-                    'background: linear-gradient(135deg, #ffffff 0%, #f8f9ff 100%); '
-                    'border: 1px solid #e6e9f3; '
-                    'border-radius: 8px; '
-                    'padding: 8px 12px; '
-                    'margin: 2px; '
-                    'box-shadow: 0 2px 8px rgba(38, 42, 255, 0.08); '
-                    'font-family: "DM Sans", -apple-system, BlinkMacSystemFont, sans-serif; '
-                    'transition: all 0.2s ease;'
-                )
-
-                if row.name % 2 == 0:
-                    # Even rows - lighter Global Blue tint
-                    bg_gradient = 'background: linear-gradient(135deg, #f6f8ff 0%, #ffffff 100%);'
-                else:
-                    # Odd rows - pure white with subtle shadow
-                    bg_gradient = 'background: linear-gradient(135deg, #ffffff 0%, #fafbff 100%);'
-                
-                # Apply to all columns
-                for col in row.index:
-                    if col == 'DBA_NAME':
-                        # Company name gets primary brand treatment
-                        styles.append(
-                            f'{bg_gradient} '
-                            f'border-left: 4px solid #262aff; '
-                            f'font-weight: 600; '
-                            f'color: #1a1b23; '
-                            f'border-radius: 8px; '
-                            f'padding: 10px 12px; '
-                            f'box-shadow: 0 3px 12px rgba(38, 42, 255, 0.12);'
-                        )
-                    elif col in ['NUMBER_OF_EMPLOYEES', 'NUMBER_OF_LOCATIONS']:
-                        # Business metrics get tertiary color accent
-                        styles.append(
-                            f'{bg_gradient} '
-                            f'border-left: 3px solid #4da8da; '
-                            f'color: #2e3748; '
-                            f'border-radius: 8px; '
-                            f'padding: 8px 12px;'
-                        )
-                    elif col in ['CONTACT_NAME', 'CONTACT_EMAIL', 'CONTACT_PHONE']:
-                        # Contact info gets subtle accent
-                        styles.append(
-                            f'{bg_gradient} '
-                            f'border-left: 2px solid #1ccbff; '
-                            f'color: #2e3748; '
-                            f'border-radius: 8px; '
-                            f'padding: 8px 12px;'
-                        )
-                    else:
-                        # Standard columns with soft UI treatment
-                        styles.append(
-                            f'{bg_gradient} '
-                            f'border: 1px solid #e6e9f3; '
-                            f'color: #2e3748; '
-                            f'border-radius: 8px; '
-                            f'padding: 8px 12px;'
-                        )
-                
-                return styles
-            
-            styled_df = styled_df.apply(apply_gp_branding, axis=1)
+            # Format only the rows on the current page; cached so page flips and reruns reuse it
+            display_df = format_page_for_display(show_df.iloc[start_idx:end_idx])
 
-            st.markdown("""
-                <style>
-                /* Global Payments Data Visualization Styling - Consolidated */
-                .stDataEditor, .stDataFrame {
-                    font-family: "DM Sans", -apple-system, BlinkMacSystemFont, sans-serif !important;
-                }
-                
-                .stDataEditor > div, .stDataFrame > div {
-                    border-radius: 12px !important;
-                    overflow: hidden !important;
-                    box-shadow: 0 4px 20px rgba(38, 42, 255, 0.08) !important;
-                    border: 1px solid #e6e9f3 !important;
-                }
-                
-                /* Header styling with Global Blue gradient */
-                .stDataEditor thead th, .stDataFrame thead th {
-                    background: linear-gradient(135deg, #262aff 0%, #4da8da 100%) !important;
-                    color: white !important;
-                    font-weight: 600 !important;
-                    padding: 12px 16px !important;
-                    border: none !important;
-                    font-size: 12px !important;
-                    text-transform: uppercase !important;
-                    letter-spacing: 0.5px !important;
-                }
-                
-                /* Row and cell styling */
-                .stDataEditor tbody tr:hover, .stDataFrame tbody tr:hover {
-                    transform: translateY(-1px) !important;
-                    box-shadow: 0 6px 24px rgba(38, 42, 255, 0.15) !important;
-                    transition: all 0.2s ease !important;
-                }
-                
-                .stDataEditor td, .stDataFrame td {
-                    border: none !important;
-                    padding: 2px !important;
-                }
-                
-                /* Accent lines for visual grouping */
-                .stDataEditor tbody tr:nth-child(5n+1) td:first-child::before, 
-                .stDataFrame tbody tr:nth-child(5n+1) td:first-child::before {
-                    content: '';
-                    position: absolute;
-                    left: 0;
-                    top: 0;
-                    height: 100%;
-                    width: 3px;
-                    background: linear-gradient(45deg, #262aff 0%, #4da8da 100%);
-                    border-radius: 0 2px 2px 0;
-                }
-                
-                /* Scrollbar styling */
-                .stDataEditor ::-webkit-scrollbar, .stDataFrame ::-webkit-scrollbar {
-                    width: 8px;
-                    height: 8px;
-                }
-                
-                .stDataEditor ::-webkit-scrollbar-track, .stDataFrame ::-webkit-scrollbar-track {
-                    background: #f1f5f9;
-                    border-radius: 4px;
-                }
-                
-                .stDataEditor ::-webkit-scrollbar-thumb, .stDataFrame ::-webkit-scrollbar-thumb {
-                    background: linear-gradient(135deg, #262aff 0%, #4da8da 100%);
-                    border-radius: 4px;
-                }
-                
-                .stDataEditor ::-webkit-scrollbar-thumb:hover, .stDataFrame ::-webkit-scrollbar-thumb:hover {
-                    background: linear-gradient(135deg, #1b1c6e 0%, #2d5a87 100%);
-                }
-                
-                /* Link styling - consolidated for all link types */
-                .stDataEditor a, .stDataFrame a {
-                    color: #262aff !important;
-                    text-decoration: none !important;
-                    font-weight: 500 !important;
-                }
-                
-                .stDataEditor a:hover, .stDataFrame a:hover {
-                    color: #1b1c6e !important;
-                    text-decoration: underline !important;
-                }
-                
-                /* Link icons */
-                .stDataEditor a[href^="tel:"]::before, .stDataFrame a[href^="tel:"]::before {
-                    content: "📞 ";
-                    font-size: 0.9em;
-                    margin-right: 4px;
-                }
-                
-                .stDataEditor a[href^="mailto:"]::before, .stDataFrame a[href^="mailto:"]::before {
-                    content: "📧 ";
-                    font-size: 0.9em;
-                    margin-right: 4px;
-                }
-                
-                /* Success message styling - minimal and compact */
-                .element-container:has(.stSuccess) {
-                    margin: -20px 0 !important;
-                    height: auto !important;
-                    min-height: 0 !important;
-                }
-                
-                .stSuccess {
-                    padding: 0 !important;
-                    min-height: 0 !important;
-                    height: auto !important;
-                    background: transparent !important;
-                    border: none !important;
-                    box-shadow: none !important;
-                }
-                
-                .stSuccess > div {
-                    padding: 0 !important;
-                    min-height: 0 !important;
-                    height: auto !important;
-                }
-                
-                .stSuccess p {
-                    font-size: 8px !important;
-                    padding: 0 !important;
-                    white-space: nowrap !important;
-                    margin: 0 !important;
-                    color: #0c8a15 !important;
-                    font-weight: 500 !important;
-                }
-                
-                .stSuccess svg {
-                    display: none !important;
-                }
-                
-                .salesforce-section {
-                    margin: 15px 0 20px 0;
-                    border-top: 1px solid #f0f2f7;
-                    padding-top: 10px;
-                }
-                </style>
-            """, unsafe_allow_html=True)
+            inject_gp_table_css()
             
             def load_data_editor():
                 # Configure columns for st.data_editor to make URLs and phone numbers clickable
@@ -4526,17 +4813,19 @@ def main():
                 
                 # Process the current selections without complex state management
                 if 'Map' in edited_df.columns and 'SF' in edited_df.columns:
-                    # Process selected businesses for map
-                    selected_for_map = edited_df[edited_df['Map'] == True].copy()
-                    st.session_state.selected_map_businesses = selected_for_map
+                    # Process selected businesses for map - session state only keeps their DATA_AGG_UIDs
+                    map_mask = edited_df['Map'].eq(True).to_numpy()
+                    selected_for_map = edited_df.loc[map_mask, 'DATA_AGG_UID']
+                    st.session_state.selected_map_uids = selected_for_map.tolist()
                     
                     if len(selected_for_map) > 0:
                         st.caption(f"📍 {len(selected_for_map)} businesses selected for mapping")
                     else:
                         st.caption("📍 No businesses selected - map will be empty")
                     
-                    # Process selected businesses for Salesforce
-                    selected_for_sf = edited_df[edited_df['SF'] == True].copy()
+                    # Process selected businesses for Salesforce - the push only needs the row index
+                    sf_mask = edited_df['SF'].eq(True).to_numpy()
+                    selected_for_sf = edited_df.loc[sf_mask, ['DBA_NAME']]
                     
                     # Don't automatically add to Salesforce - just show what's selected
                     # The actual push will happen when the button is clicked
@@ -4545,13 +4834,8 @@ def main():
                         st.caption(f"🚀 {len(selected_for_sf)} businesses selected for Salesforce")
                         
                         # Check if all selected businesses are already pushed
-                        all_pushed = True
-                        for _, business in selected_for_sf.iterrows():
-                            business_idx = business.name if hasattr(business, 'name') else None
-                            business_idx_str = str(business_idx)
-                            if business_idx_str not in get_sf_business_ids():
-                                all_pushed = False
-                                break
+                        pushed_ids = get_sf_business_id_set()
+                        all_pushed = bool(selected_for_sf.index.map(str).isin(pushed_ids).all())
                         
                         # Create columns for left-justified button layout
                         button_col1, button_col2 = create_wide_button_layout()
@@ -4566,14 +4850,7 @@ def main():
                                 button_label = "Send Selected to Salesforce"
                                 
                                 # Add CSS for button styling but remove full-width
-                                st.markdown("""
-                                <style>
-                                button[kind="primary"] span {
-                                    white-space: nowrap !important;
-                                    overflow: visible !important;
-                                }
-                                </style>
-                                """, unsafe_allow_html=True)
+                                st.markdown(NOWRAP_PRIMARY_BUTTON_CSS, unsafe_allow_html=True)
                                 
                                 if st.button(button_label, type="primary", key="sf_push_button"):
                                     # Only add to Salesforce when button is actually clicked
@@ -4592,774 +4869,8 @@ def main():
 
     
     with tab2:
-        map_styles = get_map_styles()
-        if hasattr(st.session_state, 'active_filters') and st.session_state.active_filters and has_active_filters(st.session_state.active_filters):
-            lon_col, lat_col = "LONGITUDE", "LATITUDE"
-            if lon_col in st.session_state.filtered_df.columns and lat_col in st.session_state.filtered_df.columns:
-                def fetch_map_data():
-                    cache_key = create_cache_key("map_data", st.session_state.active_filters)
-                    map_df, total_records = fetch_filtered_data(
-                        st.session_state.active_filters, cache_key, st.session_state.page_size, 1, fetch_all=True
-                    )
-                    return map_df, total_records
-
-                map_df, total_records = with_loading_spinner("Fetching all data for map...", fetch_map_data)
-                # Logical columns to display on the map
-                logical_cols = [
-                    "DBA_NAME", "NUMBER_OF_EMPLOYEES", "NUMBER_OF_LOCATIONS", "REVENUE",
-                    "ADDRESS", "CITY", "STATE", "ZIP", "PHONE", "WEBSITE", "PARENT_NAME", "PARENT_PHONE", "PARENT_WEBSITE",
-                    "CONTACT_NAME", "CONTACT_EMAIL", "CONTACT_PHONE", "CONTACT_MOBILE", "CONTACT_JOB_TITLE", "DATA_AGG_UID", 
-                    "IS_CURRENT_CUSTOMER", "TOP10_CONTACTS", "INTERNAL_DNC", "CONTACT_NATIONAL_DNC"
-                ]
-                # Always include lat/lon columns
-                all_logical_cols = [lat_col, lon_col] + logical_cols
-                # Map logical to actual column names, skipping any that are None
-                logical_to_actual = {"SIC_CODE": "SIC", "B2B": "IS_B2B", "B2C": "IS_B2C"}
-                actual_cols = [logical_to_actual.get(col, col) for col in all_logical_cols if col is not None]
-                # Only keep columns that exist in the DataFrame
-                existing_cols = [col for col in actual_cols if col in map_df.columns]
-                map_data = map_df[existing_cols].dropna(subset=[lat_col, lon_col])
-                map_data = map_data.rename(columns={lat_col: "lat", lon_col: "lon"})
-                map_data = map_data[
-                    (map_data["lat"].between(-90, 90)) &
-                    (map_data["lon"].between(-180, 180))
-                ]
-
-                # Filter map data based on selected businesses from list view
-                if hasattr(st.session_state, 'selected_map_businesses'):
-                    # User has interacted with the list view checkboxes
-                    if len(st.session_state.selected_map_businesses) > 0:
-                        # Some businesses are selected - show only those
-                        selected_business_names = st.session_state.selected_map_businesses['DBA_NAME'].tolist()
-                        map_data = map_data[map_data['DBA_NAME'].isin(selected_business_names)]
-                    else:
-                        # No businesses selected (user unchecked all) - show empty map
-                        map_data = map_data.iloc[0:0]  # Empty dataframe with same structure
-                else:
-                    # User hasn't interacted with list view yet - show all businesses by default
-                    pass
-                
-                if len(map_data) > MAP_POINTS_LIMIT:
-                    map_data = map_data.sample(n=MAP_POINTS_LIMIT, random_state=42)
-                    st.warning(f"Map limited to {MAP_POINTS_LIMIT} points for performance. Total records: {total_records}.")
-                if not map_data.empty:
-                    # Function to get tooltip style based on map style with proper data validation
-                    def get_tooltip_style(row):
-                        is_dark_map = is_dark_map_style()
-                        
-                        # Use helper functions for styling
-                        tooltip_style = create_tooltip_style(is_dark_map)
-                        header_style = create_tooltip_header_style(is_dark_map)
-
-                        # Build sections with proper data validation (same logic as selected business card)
-                        sections = build_tooltip_sections(row)
-
-                        # Generate tooltip content with consolidated styling
-                        content_html = ""
-                        for section_title, items in sections:
-                            if items:
-                                items_html = "".join(f"<div style='display: flex; align-items: center; gap: 10px; margin-bottom: 6px;'><span style='font-size: 16px;'>{item}</span></div>" for item in items)
-                                section_color = "#81c5f4" if is_dark_map else "#4da8da"
-                                content_html += f"""
-                                    <div style='margin-bottom: 16px;'>
-                                        <div style='color: {section_color}; font-weight: 700; font-size: 15px; margin-bottom: 6px; text-transform: uppercase; letter-spacing: 1px;'>{section_title}</div>
-                                        {items_html}
-                                    </div>
-                                """
-
-                        # Larger tooltip container and header
-                        return f"""
-                            <div style='{tooltip_style}; min-width: 340px; max-width: 480px; padding: 18px 22px; font-size: 16px;'>
-                                <div style='{header_style}; padding-bottom: 10px;'>
-                                    <span style='background: rgba(255, 255, 255, 0.2); width: 32px; height: 32px; display: inline-flex; align-items: center; justify-content: center; border-radius: 8px; font-size: 22px;'>🏢</span>
-                                    <span style='font-size: 22px; font-weight: 700; line-height: 1.2; margin-left: 10px;'>{row['DBA_NAME']}</span>
-                                </div>
-                                <div style='padding: 6px 0;'>
-                                    {content_html}
-                                </div>
-                            </div>
-                        """
-                    
-                    map_data["tooltip"] = map_data.apply(get_tooltip_style, axis=1)
-                    map_data["index"] = map_data.index
-                    min_lat, max_lat = map_data["lat"].min(), map_data["lat"].max()
-                    min_lon, max_lon = map_data["lon"].min(), map_data["lon"].max()
-                    center_lat = (min_lat + max_lat) / 2
-                    center_lon = (min_lon + max_lon) / 2
-                    lat_diff = max_lat - min_lat
-                    lon_diff = max_lon - min_lon
-                    
-                    # Add padding buffer for better visibility, especially with few points
-                    padding_factor = 0.3  # 30% padding around the points
-                    lat_diff = max(lat_diff, 0.01) + (lat_diff * padding_factor)  # Minimum diff for very close points
-                    lon_diff = max(lon_diff, 0.01) + (lon_diff * padding_factor)
-                    
-                    if lat_diff == 0 or lon_diff == 0:
-                        default_zoom = DEFAULT_MAP_ZOOM  # Reduced from 11 for better initial view
-                        initial_radius = 200
-                    else:
-                        viewport_width = 800
-                        viewport_height = 600
-                        lat_zoom = math.log2(360 * viewport_height / (lat_diff * 256))
-                        lon_zoom = math.log2(360 * viewport_width / (lon_diff * 256 * math.cos(math.radians(center_lat))))
-                        # Reduced zoom calculation for better visibility with few points
-                        default_zoom = min(lat_zoom, lon_zoom) - 2  # Changed from -1 to -2 for more zoom out
-                        
-                        # Special handling for small number of points
-                        if len(map_data) <= 3:
-                            default_zoom = min(default_zoom, 10)  # Cap zoom for few points
-                        
-                        default_zoom = max(2, min(15, round(default_zoom)))
-                        initial_radius = max(50, 500000 / (2 ** default_zoom))
-                    
-                    # Initialize map-related session state
-                    init_session_state_key("initial_radius_scale", 1.0)
-                    init_session_state_key("selected_radius_scale", 1.0)
-                    init_session_state_key("default_selected_radius_scale", 1.0)
-                    init_session_state_key("map_view_state", {
-                            "latitude": center_lat,
-                            "longitude": center_lon,
-                            "zoom": default_zoom
-                        })
-                    init_session_state_key("selected_business_indices", [])
-                    
-                    # Migrate from old single selection to new multiple selection (if it exists)
-                    if hasattr(st.session_state, 'selected_business_index') and st.session_state.selected_business_index is not None:
-                        st.session_state.selected_business_indices = [st.session_state.selected_business_index]
-                        delattr(st.session_state, 'selected_business_index')
-                    
-                    # Clean up any indices that are no longer in the data
-                    st.session_state.selected_business_indices = [
-                        idx for idx in st.session_state.selected_business_indices 
-                        if idx in map_data.index
-                    ]
-                    # Sort businesses alphabetically by name for better user experience
-                    sorted_map_data = map_data.sort_values("DBA_NAME")
-                    
-                    # Create business options as list of DATA_AGG_UIDs (unique IDs)
-                    business_options = [row["DATA_AGG_UID"] for _, row in sorted_map_data.iterrows()]
-                    # Map UID to index and UID to display name (optionally with address for clarity)
-                    business_uid_to_index = {row["DATA_AGG_UID"]: row["index"] for _, row in sorted_map_data.iterrows()}
-                    # Assign a display number for each duplicate DBA_NAME
-                    dba_name_counts = {}
-                    business_uid_to_label = {}
-                    for _, row in sorted_map_data.iterrows():
-                        dba = row["DBA_NAME"]
-                        dba_name_counts[dba] = dba_name_counts.get(dba, 0) + 1
-                        display_number = dba_name_counts[dba]
-                        # Only add [n] if there are duplicates
-                        if list(sorted_map_data["DBA_NAME"]).count(dba) > 1:
-                            label = f"{dba} [{display_number}]"
-                        else:
-                            label = dba
-                        business_uid_to_label[row["DATA_AGG_UID"]] = label
-
-                    # Get current selection for multiselect (as DATA_AGG_UIDs)
-                    current_selection = []
-                    if st.session_state.selected_business_indices:
-                        for idx in st.session_state.selected_business_indices:
-                            match = sorted_map_data.loc[sorted_map_data["index"] == idx]
-                            if not match.empty:
-                                current_selection.append(match.iloc[0]["DATA_AGG_UID"])
-
-                    # Use multiselect with DATA_AGG_UID as value, DBA_NAME (and address) as display
-                    selected_businesses = st.multiselect(
-                        "🔍 Search and select up to 5 businesses to view details",
-                        options=business_options,
-                        default=current_selection,
-                        key="business_multiselect",
-                        help="Type to search and select up to 5 businesses - alphabetically sorted",
-                        max_selections=5,
-                        placeholder="Type to search business names...",
-                        format_func=lambda uid: business_uid_to_label.get(uid, str(uid))
-                    )
+        render_map_tab()
 
-                    # Handle selection logic - allow multiple selections
-                    selected_indices = []
-                    if selected_businesses:
-                        selected_indices = [business_uid_to_index[uid] for uid in selected_businesses]
-                    
-                    # Show total count
-                    if hasattr(st.session_state, 'selected_map_businesses'):
-                        if len(st.session_state.selected_map_businesses) > 0:
-                            st.caption(f"Showing {len(map_data)} selected businesses on map • {len(selected_businesses)}/5 selected")
-                        else:
-                            st.caption(f"No businesses selected for mapping - map is empty • {len(selected_businesses)}/5 selected")
-                    else:
-                        st.caption(f"Showing all {len(map_data)} businesses on map (default) • {len(selected_businesses)}/5 selected")
-                    
-                    # Update session state with new selections
-                    if set(selected_indices) != set(st.session_state.selected_business_indices):
-                        st.session_state.selected_business_indices = selected_indices
-                        
-                        # Calculate new map view state to encompass all selected businesses
-                        if selected_indices:
-                            selected_data = map_data.loc[map_data.index.isin(selected_indices)]
-                            if len(selected_indices) == 1:
-                                # Single selection - zoom in close
-                                single_business = selected_data.iloc[0]
-                                st.session_state.map_view_state = {
-                                    "latitude": float(single_business["lat"]),
-                                    "longitude": float(single_business["lon"]),
-                                    "zoom": SELECTED_BUSINESS_ZOOM
-                                }
-                            else:
-                                # Multiple selections - fit all businesses in view with padding
-                                selected_lat_min, selected_lat_max = selected_data["lat"].min(), selected_data["lat"].max()
-                                selected_lon_min, selected_lon_max = selected_data["lon"].min(), selected_data["lon"].max()
-                                selected_center_lat = (selected_lat_min + selected_lat_max) / 2
-                                selected_center_lon = (selected_lon_min + selected_lon_max) / 2
-                                
-                                # Calculate base differences
-                                selected_lat_diff = selected_lat_max - selected_lat_min
-                                selected_lon_diff = selected_lon_max - selected_lon_min
-                                
-                                # Add padding buffer for better visibility (SAME AS INITIAL MAP VIEW)
-                                padding_factor = 0.3  # 30% padding around the points (matching initial view)
-                                selected_lat_diff = max(selected_lat_diff, 0.01) + (selected_lat_diff * padding_factor)
-                                selected_lon_diff = max(selected_lon_diff, 0.01) + (selected_lon_diff * padding_factor)
-                                
-                                if selected_lat_diff == 0 or selected_lon_diff == 0:
-                                    selected_zoom = DEFAULT_MAP_ZOOM  # Same as initial view for zero diff
-                                else:
-                                    # Calculate zoom level to fit the padded area (SAME AS INITIAL MAP VIEW)
-                                    viewport_width = 800
-                                    viewport_height = 600
-                                    lat_zoom = math.log2(360 * viewport_height / (selected_lat_diff * 256))
-                                    lon_zoom = math.log2(360 * viewport_width / (selected_lon_diff * 256 * math.cos(math.radians(selected_center_lat))))
-                                    
-                                    # Reduced zoom calculation for better visibility (SAME AS INITIAL MAP VIEW)
-                                    selected_zoom = min(lat_zoom, lon_zoom) - 2  # Same -2 reduction as initial view
-                                    
-                                    # Special handling for 2-3 business selections (more aggressive zoom-in)
-                                    num_selected = len(st.session_state.selected_business_indices)
-                                    if num_selected == 2 or num_selected == 3:
-                                        # For 2-3 businesses, use a much higher minimum zoom for closer view
-                                        selected_zoom = max(selected_zoom, 11)  # Increased from 8 to 11 for much closer view
-                                        selected_zoom = min(selected_zoom, 14)  # Allow up to 14 for very close viewing
-                                    elif num_selected <= 3:
-                                        # For other small numbers, use the original logic
-                                        selected_zoom = max(selected_zoom, 8)
-                                        selected_zoom = min(selected_zoom, 12)
-                                    
-                                    # Ensure reasonable zoom bounds (SAME AS INITIAL MAP VIEW)
-                                    selected_zoom = max(4, min(15, round(selected_zoom)))  # Raised minimum from 2 to 4
-                                
-                                st.session_state.map_view_state = {
-                                    "latitude": selected_center_lat,
-                                    "longitude": selected_center_lon,
-                                    "zoom": selected_zoom
-                                }
-                            
-                            base_selected_scale = 30 / initial_radius if initial_radius != 0 else 1.0
-                            st.session_state.selected_radius_scale = base_selected_scale
-                            st.session_state.default_selected_radius_scale = base_selected_scale
-                        else:
-                            # No selection - reset to default view
-                            st.session_state.map_view_state = {
-                                "latitude": center_lat,
-                                "longitude": center_lon,
-                                "zoom": default_zoom
-                            }
-                            st.session_state.initial_radius_scale = 1.0
-                            st.session_state.selected_radius_scale = 1.0
-                            st.session_state.default_selected_radius_scale = 1.0
-                        st.rerun()
-                    
-                    # Function to get non-selected point color based on map style
-                    def get_non_selected_color():
-                        current_map_style = get_current_map_style()
-                        # For light and streets maps: use dark blue (Deep Blue)
-                        if current_map_style in [":material/light_mode:", ":material/terrain:"]:
-                            return [27, 30, 198, 100]  # Global Payments Deep Blue
-                        # For dark and satellite maps: use a much lighter blue (lighter than Pulse Blue)  
-                        else:  # dark_mode or satellite_alt
-                            return [173, 216, 255, 100]  # Light Sky Blue (lighter derivative of Global Blue palette)
-
-                    # Function to get color for each map point, overriding for current customers
-                    def get_map_point_color(row, selected=False):
-                        if row.get('IS_CURRENT_CUSTOMER', False) is True:
-                            return [244, 54, 76, 200]  # Global Raspberry
-                        if selected:
-                            # Use selected business color logic (existing)
-                            idx = st.session_state.selected_business_indices.index(row['index']) if row['index'] in st.session_state.selected_business_indices else 0
-                            selected_colors = [
-                                [38, 42, 255, 200],     # Global Blue
-                                [255, 204, 0, 200],     # Sunshine
-                                [253, 160, 82, 200],    # Creamsicle
-                                [135, 23, 157, 200],    # Grape
-                                [28, 171, 255, 200],    # Pulse Blue
-                            ]
-                            return selected_colors[idx % len(selected_colors)]
-                        return get_non_selected_color()
-                    
-                    # Display selected business details
-                    if st.session_state.selected_business_indices:
-                        # Define colors for selected businesses using Global Payments tertiary palette
-                        selected_colors = [
-                            [38, 42, 255, 200],     # Global Blue
-                            [255, 204, 0, 200],    # Sunshine
-                            [253, 160, 82, 200],   # Creamsicle
-                            [135, 23, 157, 200],   # Grape
-                            [28, 171, 255, 200],   # Pulse Blue
-                        ]
-                        
-                        selected_business_data = map_data.loc[map_data.index.isin(st.session_state.selected_business_indices)]
-                        
-                        
-                        def format_business_data_html(business_data):
-                            """Generate business card HTML with simplified structure"""
-                            business_idx_str = str(business_data.name if hasattr(business_data, 'name') else business_data.get('BUSINESS_ID', ''))
-                            already_pushed = business_idx_str in get_sf_business_ids()
-                            
-
-                            # Add INTERNAL_DNC flag if needed
-                            dnc_flag = ''
-                            dnc_val = business_data.get("INTERNAL_DNC")
-                            if dnc_val == 1:
-                                dnc_flag = '<span style="color:red; font-weight:bold; font-size:1.1em; margin-left:12px;">🚫 INTERNAL DNC</span>'
-
-                            # Build header
-                            sf_status = '<span class="sf-push-status">✓ Pushed to Salesforce</span>' if already_pushed else ''
-                            header = f'<h3><div class="business-name-container">{business_data["DBA_NAME"]}{dnc_flag}</div>{sf_status}</h3>'
-                            
-                            # Build sections using consolidated helper
-                            sections = build_business_card_sections(business_data)
-                            
-                            return f'''<div class="business-details-card">{header}<div class="business-data-dashboard">{"".join(sections)}</div></div>'''
-                        
-                        if len(st.session_state.selected_business_indices) == 1:
-                            # Single business - show full details
-                            business_data = selected_business_data.iloc[0]
-                            st.markdown(format_business_data_html(business_data), unsafe_allow_html=True)
-                            
-                            # Add native Streamlit button for Salesforce action
-                            business_idx = business_data.name if hasattr(business_data, 'name') else None
-                            sf_key = f"sf_push_{business_idx}"
-                            business_name = business_data.get("DBA_NAME", "")
-                            
-                            # Check if this business was already pushed to Salesforce
-                            business_idx_str = str(business_idx)
-                            already_pushed = business_idx_str in get_sf_business_ids()
-                            
-                            if not already_pushed:
-                                # Create columns for left-justified button
-                                sf_cols = create_button_layout()
-                                with sf_cols[0]:  # Button in left column
-                                    # Updated button label with business name
-                                    button_label = f"Send {business_name} to Salesforce"
-                                    
-                                    push_button = st.button(button_label, type="primary", key=sf_key)
-                                    
-                                    if push_button:
-                                        # Make sure we have the complete business data
-                                        business_idx = business_data.name if hasattr(business_data, 'name') else None
-                                        
-                                        # Add this business to Salesforce
-                                        add_business_to_salesforce(business_idx)
-                                        
-                                        # Show success message with compact styling
-                                        success_msg = f'<p style="color:#0c8a15; font-size:11px; margin:0; padding:0; font-weight:500;">✓ Added to Salesforce</p>'
-                                        st.markdown(success_msg, unsafe_allow_html=True)
-                                        
-                                        # Log for debugging
-                                        print(f"Pushed business ID {business_idx} to Salesforce")
-                                        print(f"Total businesses in Salesforce: {st.session_state.sf_pushed_count}")
-                                        
-                                        # Rerun to update UI
-                                        st.rerun()
-                        else:
-                            # Multiple businesses - show in tabs and add bulk actions
-                            
-                            # Check if all selected businesses are already pushed
-                            all_pushed = True
-                            for idx in st.session_state.selected_business_indices:
-                                if str(idx) not in get_sf_business_ids():
-                                    all_pushed = False
-                                    break
-                            
-                            # Add compact bulk push button - left justified
-                            # Create columns for left-justified button layout
-                            btn_col1, btn_col2 = create_button_layout()
-                            
-                            with btn_col1:
-                                if all_pushed:
-                                    # Use markdown with custom styling - left-justified
-                                    st.markdown('<p style="color:#0c8a15; font-size:11px; margin:0; padding:0; font-weight:500;">✓ All pushed</p>', unsafe_allow_html=True)
-                                else:
-                                    # Updated button label
-                                    button_label = "Send Selected to Salesforce"
-                                    
-                                    # Add CSS to prevent button text wrapping
-                                    st.markdown("""
-                                    <style>
-                                    button[kind="primary"] span {
-                                        white-space: nowrap !important;
-                                        overflow: visible !important;
-                                    }
-                                    </style>
-                                    """, unsafe_allow_html=True)
-                                    
-                                    bulk_push = st.button(button_label, 
-                                                type="primary", key="sf_bulk_push_button")
-                                    if bulk_push:
-                                        # Get the subset of businesses that are selected
-                                        selected_businesses = selected_business_data.loc[selected_business_data.index.isin(st.session_state.selected_business_indices)].copy()
-                                        
-                                        # Add each business to Salesforce
-                                        count = add_businesses_to_salesforce(selected_businesses)
-                                        
-                                        # Rerun to update UI
-                                        st.rerun()
-                            
-                            # Multiple businesses - show in tabs
-                            business_names = []
-                            for idx in st.session_state.selected_business_indices:
-                                name = selected_business_data.loc[selected_business_data.index == idx, "DBA_NAME"].iloc[0]
-                                # Add indicator if already pushed
-                                idx_str = str(idx)
-                                already_pushed = idx_str in get_sf_business_ids()
-                                if already_pushed:
-                                    name = f"{name} ✓"
-                                business_names.append(name)
-                            
-                            tab_labels = [f"📍 {name[:25]}..." if len(name) > 25 else f"📍 {name}" for name in business_names]
-                            selected_tabs = st.tabs(tab_labels)
-                            
-                            for i, (tab, idx) in enumerate(zip(selected_tabs, st.session_state.selected_business_indices)):
-                                with tab:
-                                    business_data = selected_business_data.loc[selected_business_data.index == idx].iloc[0]
-                                    st.markdown(format_business_data_html(business_data), unsafe_allow_html=True)
-                                    
-                                    # Add native Streamlit button for Salesforce action
-                                    business_idx = business_data.name if hasattr(business_data, 'name') else None
-                                    sf_key = f"sf_push_tab_{i}_{business_idx}"
-                                    business_name = business_data.get("DBA_NAME", "")
-                                    
-                                    # Check if this business was already pushed to Salesforce
-                                    business_idx_str = str(business_idx)
-                                    already_pushed = business_idx_str in get_sf_business_ids()
-                                    
-                                    # Create a smaller, more compact layout with columns
-                                    if already_pushed:
-                                        # No button needed, so no columns needed
-                                        pass
-                                    else:
-                                        # Determine column ratio based on business name length - more space for longer names
-                                        # This helps ensure the button text stays on one line
-                                        left_col_size = 1
-                                        right_col_size = 1
-                                        
-                                        if len(business_name) <= 10:
-                                            # Very short names
-                                            left_col_size, right_col_size = 2, 1  # 2:1 ratio
-                                        elif len(business_name) <= 20:
-                                            # Medium length names
-                                            left_col_size, right_col_size = 1, 1  # 1:1 ratio
-                                        else:
-                                            # Long names
-                                            left_col_size, right_col_size = 1, 2  # 1:2 ratio
-                                        
-                                        # Create a dynamic layout with columns for left-justified button
-                                        sf_cols = create_button_layout()
-                                        with sf_cols[0]:  # Button in left column
-                                            # Updated button label with business name
-                                            button_label = f"Send {business_name} to Salesforce"
-                                            
-                                            push_button = st.button(button_label, type="primary", key=sf_key)
-                                            
-                                            if push_button:
-                                                # Get the business ID
-                                                business_idx = business_data.name if hasattr(business_data, 'name') else None
-                                                
-                                                # Add to Salesforce
-                                                add_business_to_salesforce(business_idx)
-                                                
-                                                # Rerun to update UI
-                                                st.rerun()
-                                                st.write("Updating Salesforce tab data...")
-                                                
-                                                # Show current state
-                                                st.write(f"Total businesses in Salesforce: {st.session_state.sf_pushed_count}")
-                                                st.write(f"Business IDs in Salesforce: {st.session_state.sf_business_ids}")
-                                                
-                                                # Continue only if the user clicks to confirm
-                                                if st.button("Continue", key=f"tab_continue_{i}"):
-                                                    st.rerun()
-                        
-
-                    
-                    # Create map layers with multiple selection support
-                    layers = []
-                    
-                    if st.session_state.selected_business_indices:
-                        # Calculate dynamic radius based on zoom level and selection count
-                        current_zoom = st.session_state.map_view_state["zoom"]
-                        selection_count = len(st.session_state.selected_business_indices)
-                        
-                        # Dynamic radius calculation with better zoom scaling (reduced by ~50% for better visual clarity)
-                        if selection_count == 1:
-                            # Single selection - scale down radius for high zoom levels (reduced by ~75% total)
-                            if current_zoom >= 15:
-                                dynamic_radius_multiplier = st.session_state.selected_radius_scale * 0.025  # Much smaller for very close zoom
-                            elif current_zoom >= 13:
-                                dynamic_radius_multiplier = st.session_state.selected_radius_scale * 0.075  # Smaller for close zoom
-                            elif current_zoom >= 11:
-                                dynamic_radius_multiplier = st.session_state.selected_radius_scale * 0.15   # Medium size
-                            else:
-                                dynamic_radius_multiplier = st.session_state.selected_radius_scale * 0.25   # Reduced for far zoom
-                        else:
-                            # Multiple selections - scale based on zoom level (reduced by ~75% total)
-                            base_multiplier = st.session_state.selected_radius_scale
-                            
-                            # Zoom-based scaling: higher zoom = much smaller points
-                            if current_zoom >= 15:
-                                zoom_scale = 0.025  # Very small for very close zoom
-                            elif current_zoom >= 13:
-                                zoom_scale = 0.125  # Small for close zoom
-                            elif current_zoom >= 11:
-                                zoom_scale = 0.5   # Medium for medium zoom
-                            elif current_zoom <= 8:
-                                zoom_scale = 4.0  # Larger for far zoom
-                            else:
-                                zoom_scale = 2.0  # Default for other zoom levels
-                            
-                            dynamic_radius_multiplier = base_multiplier * zoom_scale
-                        
-                        # Separate selected and non-selected businesses
-                        non_selected_data = map_data[~map_data.index.isin(st.session_state.selected_business_indices)]
-                        
-                        # Create separate radius calculation for map view selected businesses (reduced by ~50% for better visual clarity)
-                        map_view_radius_multiplier = st.session_state.selected_radius_scale
-                        if current_zoom >= 15:
-                            map_view_radius_multiplier *= 1.0  # Smaller for very close zoom
-                        elif current_zoom >= 13:
-                            map_view_radius_multiplier *= 1.5  # Smaller for close zoom
-                        elif current_zoom >= 11:
-                            map_view_radius_multiplier *= 2.0  # Medium-small size
-                        else:
-                            map_view_radius_multiplier *= 2.5  # Reduced for far zoom
-                        
-                        # Add non-selected businesses layer (precompute fill_color)
-                        if not non_selected_data.empty:
-                            non_selected_data = non_selected_data.copy()
-                            non_selected_data["fill_color"] = non_selected_data.apply(lambda row: get_map_point_color(row, selected=False), axis=1)
-                            layers.append(
-                                pdk.Layer(
-                                    "ScatterplotLayer",
-                                    data=non_selected_data,
-                                    get_position=["lon", "lat"],
-                                    get_fill_color="fill_color",
-                                    get_radius=initial_radius * map_view_radius_multiplier * 0.9 * 0.9,
-                                    pickable=True,
-                                    auto_highlight=True
-                                )
-                            )
-                        
-                        # Add each selected business as a separate layer with 3D columns/pillars
-                        for i, business_idx in enumerate(st.session_state.selected_business_indices):
-                            if business_idx in map_data.index:
-                                selected_data = map_data.loc[[business_idx]]
-                                # Use ColumnLayer for selected businesses to make them stand out as 3D pillars
-                                selected_data = selected_data.copy()
-                                selected_data["fill_color"] = selected_data.apply(lambda row: get_map_point_color(row, selected=True), axis=1)
-                                layers.append(
-                                    pdk.Layer(
-                                        "ColumnLayer",
-                                        data=selected_data,
-                                        get_position=["lon", "lat"],
-                                        get_fill_color="fill_color",
-                                        get_elevation=20,
-                                        elevation_scale=initial_radius * map_view_radius_multiplier * 0.05,
-                                        radius=initial_radius * map_view_radius_multiplier * 0.9,
-                                        pickable=True,
-                                        auto_highlight=True
-                                    )
-                                )
-                    else:
-                        # No selection - show all businesses, precompute fill_color
-                        map_data = map_data.copy()
-                        map_data["fill_color"] = map_data.apply(lambda row: get_map_point_color(row, selected=False), axis=1)
-                        layers.append(
-                            pdk.Layer(
-                                "ScatterplotLayer",
-                                data=map_data,
-                                get_position=["lon", "lat"],
-                                get_fill_color="fill_color",
-                                get_radius=initial_radius * st.session_state.initial_radius_scale,
-                                pickable=True,
-                                auto_highlight=True
-                            )
-                        )
-                    
-                    # Create map view state
-                    view_state = pdk.ViewState(
-                        latitude=float(st.session_state.map_view_state["latitude"]),
-                        longitude=float(st.session_state.map_view_state["longitude"]),
-                        zoom=int(st.session_state.map_view_state["zoom"]),
-                        pitch=0
-                    )
-                    
-                    # Create tooltip
-                    tooltip = {
-                        "html": "{tooltip}",
-                        "style": {
-                            "background-color": "transparent",
-                            "color": "transparent",
-                            "padding": "0",
-                            "box-shadow": "none",
-                            "border-radius": "0"
-                        }
-                    }
-                    
-                    # Create and display the map
-                    deck = pdk.Deck(
-                        layers=layers,
-                        initial_view_state=view_state,
-                        map_style=map_styles.get(get_current_map_style()),
-                        tooltip=tooltip
-                    )
-                    
-                    # No longer need JavaScript for Salesforce buttons - using native Streamlit buttons
-                    
-                    #st.markdown(f"**Total Businesses Displayed:** {len(map_data)}")
-                    st.pydeck_chart(deck)
-                    
-                    # Map controls styling
-                    st.markdown(
-                        """
-                        <style>
-                        div[data-testid="stHorizontalBlock"] > div:first-child {
-                            display: flex;
-                            justify-content: flex-start;
-                            align-items: center;
-                            padding-left: 0;
-                            margin-left: 0;
-                        }
-                        div[data-testid="stHorizontalBlock"] > div:first-child > div[data-testid="stHorizontalBlock"] {
-                            display: flex;
-                            justify-content: flex-start;
-                            gap: 4px;
-                            margin: 0;
-                            padding: 0;
-                        }
-                        div[data-testid="stHorizontalBlock"] > div:first-child button[kind="secondary"] {
-                            padding: 6px;
-                            font-size: 12px;
-                            width: 36px;
-                            height: 36px;
-                            min-width: unset;
-                            border: 1px solid #e6e6e6;
-                            background-color: #f0f2f6;
-                            color: #333333;
-                            border-radius: 4px;
-                        }
-                        div[data-testid="stHorizontalBlock"] > div:last-child {
-                            display: flex;
-                            justify-content: flex-end;
-                            align-items: center;
-                            padding-right: 0;
-                            margin-right: 0;
-                        }
-                        </style>
-                        """,
-                        unsafe_allow_html=True
-                    )
-                    
-                    # Map controls
-                    col_left, col_spacer, col_right = create_map_controls_layout()
-                    with col_left:
-                        col_larger, col_reset, col_smaller = create_radius_controls_layout()
-                        with col_smaller:
-                            if st.button(":material/remove:", key="radius_smaller", use_container_width=True, help="Shrink map points"):
-                                adjust_radius_scale(0.5)
-                                st.rerun()
-                        with col_larger:
-                            if st.button(":material/add:", key="radius_larger", use_container_width=True, help="Enlarge map points"):
-                                adjust_radius_scale(2.0)
-                                st.rerun()
-                        with col_reset:
-                            if st.button(":material/refresh:", key="radius_refresh", use_container_width=True, help="Reset map points radius"):
-                                reset_radius_scale()
-                                st.rerun()
-                    with col_right:
-                        # Map style buttons arranged in single row
-                        style_col1, style_col2, style_col3, style_col4 = create_map_style_buttons_layout()
-                        
-                        current_style = get_current_map_style()
-                        
-                        create_map_style_button(
-                            ":material/light_mode:",
-                            "map_style_light", 
-                            "Light map style",
-                            current_style,
-                            style_col1
-                        )
-                        
-                        create_map_style_button(
-                            ":material/dark_mode:",
-                            "map_style_dark",
-                            "Dark map style", 
-                            current_style,
-                            style_col2
-                        )
-                        
-                        create_map_style_button(
-                            ":material/satellite_alt:",
-                            "map_style_satellite",
-                            "Satellite map style",
-                            current_style,
-                            style_col3
-                        )
-                        
-                        create_map_style_button(
-                            ":material/terrain:",
-                            "map_style_terrain",
-                            "Street map style",
-                            current_style,
-                            style_col4
-                        )
-                else:
-                    init_session_state_key("map_view_state", {
-                        "latitude": 39.8283,
-                        "longitude": -98.5795,
-                        "zoom": 4
-                    })
-                    st.warning("No valid longitude/latitude data available after filtering.")
-                    view_state = pdk.ViewState(
-                        latitude=float(st.session_state.map_view_state["latitude"]),
-                        longitude=float(st.session_state.map_view_state["longitude"]),
-                        zoom=int(st.session_state.map_view_state["zoom"]),
-                        pitch=0
-                    )
-                    deck = pdk.Deck(
-                        layers=[],
-                        initial_view_state=view_state,
-                        map_style=map_styles.get(get_current_map_style())
-                    )
-                    st.pydeck_chart(deck)
-            else:
-                st.error(f"Map requires '{lon_col}' and '{lat_col}' columns in the table.")
-                init_session_state_key("map_view_state", {
-                    "latitude": 39.8283,
-                    "longitude": -98.5795,
-                    "zoom": 4
-                })
-                view_state = pdk.ViewState(
-                    latitude=float(st.session_state.map_view_state["latitude"]),
-                    longitude=float(st.session_state.map_view_state["longitude"]),
-                    zoom=int(st.session_state.map_view_state["zoom"]),
-                    pitch=0
-                )
-                deck = pdk.Deck(
-                    layers=[],
-                    initial_view_state=view_state,
-                    map_style=map_styles.get(get_current_map_style())
-                )
-                st.pydeck_chart(deck)
-        # else:
-            # Removed redundant message - already shown in active filters section
-    
     with tab3:
         st.markdown("""
         <div style="padding: 20px; border-radius: 12px; background: linear-gradient(135deg, #f8faff 0%, #ffffff 100%); 
@@ -5481,12 +4992,13 @@ def main():
                 
                 # Reset all Salesforce-related variables
                 st.session_state.sf_business_ids = []
+                st.session_state.sf_business_id_set = set()
                 st.session_state.sf_pushed_count = 0
                 st.session_state.sf_last_update = datetime.now().isoformat()
                 
                 # Also clear any other Salesforce-related variables that might exist
                 for key in list(st.session_state.keys()):
-                    if key.startswith("sf_") and key not in ["sf_business_ids", "sf_pushed_count", "sf_last_update"]:
+                    if key.startswith("sf_") and key not in ["sf_business_ids", "sf_business_id_set", "sf_pushed_count", "sf_last_update"]:
                         del st.session_state[key]
                 
                 # Debug output